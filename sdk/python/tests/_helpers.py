@@ -0,0 +1,22 @@
+"""
+Plain helpers shared by SDK unit tests.
+"""
+from typing import Any
+from unittest.mock import Mock
+
+import orjson
+
+
+def json_response(payload: Any, status_code: int = 200) -> Mock:
+    """Build a mock httpx response whose body round-trips through orjson.
+
+    ``.content`` holds the encoded bytes and ``.json()`` decodes them on each
+    call, so SDK code exercises a real parse instead of receiving the
+    original dict object.
+    """
+    resp = Mock()
+    resp.status_code = status_code
+    resp.content = orjson.dumps(payload)
+    resp.json = lambda: orjson.loads(resp.content)
+    resp.raise_for_status = Mock()
+    return resp
@@ -0,0 +1,37 @@
+"""
+Shared pytest fixtures for SDK unit tests.
+"""
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from soorma.registry.client import RegistryClient
+
+# Event loops read this when created; an inherited debug flag would add
+# traceback capture and slow-callback checks to every awaited mock
+os.environ.pop("PYTHONASYNCIODEBUG", None)
+
+
+@pytest.fixture(scope="session")
+def _shared_registry_client() -> RegistryClient:
+    """Single RegistryClient instance, constructed once per test session.
+
+    It is built over a mock HTTP client, so no real httpx.AsyncClient is
+    opened (and left unclosed) for the session.
+    """
+    with patch("soorma.registry.client.httpx.AsyncClient", return_value=AsyncMock()):
+        return RegistryClient(base_url="http://test-registry")
+
+
+@pytest.fixture
+def registry_client(_shared_registry_client: RegistryClient) -> RegistryClient:
+    """Return the shared RegistryClient with a fresh mocked HTTP client.
+
+    Auth configuration is cleared so every test starts from the same
+    unauthenticated state.
+    """
+    client = _shared_registry_client
+    client._client = AsyncMock()
+    client.set_auth_token(None)
+    client.set_auth_token_provider(None)
+    return client
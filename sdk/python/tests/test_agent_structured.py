@@ -1,30 +1,39 @@
 """
 Tests for Agent initialization with structured definitions (Capabilities and Events).
 """
+import functools
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from soorma import Agent, Planner, Worker, Tool
 from soorma.models import AgentCapability, EventDefinition
 
+
+@functools.cache
+def _structured_capability() -> AgentCapability:
+    """Shared read-only capability, validated once for the whole module."""
+    return AgentCapability(
+        task_name="structured_cap",
+        description="A structured capability",
+        consumed_event=EventDefinition(
+            event_name="structured.request",
+            topic="action-requests",
+            description="Structured request event"
+        ),
+        produced_events=[EventDefinition(
+            event_name="structured.response",
+            topic="action-results",
+            description="Structured response event"
+        )]
+    )
+
+
 class TestAgentStructured:
     """Tests for Agent with structured capabilities and events."""
 
     def test_agent_with_structured_capabilities(self):
         """Test initializing an agent with AgentCapability objects."""
-        cap = AgentCapability(
-            task_name="structured_cap",
-            description="A structured capability",
-            consumed_event=EventDefinition(
-                event_name="structured.request",
-                topic="action-requests",
-                description="Structured request event"
-            ),
-            produced_events=[EventDefinition(
-                event_name="structured.response",
-                topic="action-results",
-                description="Structured response event"
-            )]
-        )
+        cap = _structured_capability()
 
         agent = Agent(
             name="structured-agent",
@@ -37,20 +46,7 @@ class TestAgentStructured:
 
     def test_agent_with_mixed_capabilities(self):
         """Test initializing an agent with mixed string and structured capabilities."""
-        cap = AgentCapability(
-            task_name="structured_cap",
-            description="A structured capability",
-            consumed_event=EventDefinition(
-                event_name="structured.request",
-                topic="action-requests",
-                description="Structured request event"
-            ),
-            produced_events=[EventDefinition(
-                event_name="structured.response",
-                topic="action-results",
-                description="Structured response event"
-            )]
-        )
+        cap = _structured_capability()
 
         agent = Agent(
             name="mixed-agent",
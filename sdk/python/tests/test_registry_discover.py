@@ -7,10 +7,9 @@ Run:
     pytest sdk/python/tests/test_registry_discover.py -v
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import Mock
 import httpx
 
-from soorma.registry.client import RegistryClient
 from soorma_common import (
     AgentDefinition,
     AgentCapability,
@@ -18,25 +17,16 @@ from soorma_common import (
     DiscoveredAgent,
 )
 
+from ._helpers import json_response
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-def _make_registry_client() -> RegistryClient:
-    """Return a RegistryClient with a mocked HTTP client."""
-    client = RegistryClient(base_url="http://test-registry")
-    client._client = AsyncMock()
-    return client
-
-
-def _make_agent_mock_response(agents_json: list) -> MagicMock:
+def _make_agent_mock_response(agents_json: list) -> Mock:
     """Build a mock HTTP response returning an AgentQueryResponse-shaped dict."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"agents": agents_json, "count": len(agents_json)}
-    mock_response.raise_for_status = MagicMock()  # no-op (success)
-    return mock_response
+    return json_response({"agents": agents_json, "count": len(agents_json)})
 
 
 def _sample_agent_dict(name: str = "SearchWorker:1.0.0") -> dict:
@@ -72,14 +62,13 @@ def _sample_agent_dict(name: str = "SearchWorker:1.0.0") -> dict:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_discover_returns_discovered_agent_list():
+async def test_discover_returns_discovered_agent_list(registry_client):
     """discover() returns a list of DiscoveredAgent (not AgentDefinition)."""
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response(
+    registry_client._client.get.return_value = _make_agent_mock_response(
         [_sample_agent_dict()]
     )
 
-    result = await client.discover(requirements=["web_search"])
+    result = await registry_client.discover(requirements=["web_search"])
 
     assert isinstance(result, list)
     assert len(result) == 1
@@ -87,20 +76,19 @@ async def test_discover_returns_discovered_agent_list():
 
 
 @pytest.mark.asyncio
-async def test_discover_calls_discover_endpoint_without_filter_params():
+async def test_discover_calls_discover_endpoint_without_filter_params(registry_client):
     """discover() calls /v1/agents/discover with no query params and filters client-side.
 
     The service endpoint only supports consumed_event filtering (by event name),
     not task_name filtering.  discover() fetches all agents and applies the
     requirements filter in Python, so no query params should be sent.
     """
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response([])
+    registry_client._client.get.return_value = _make_agent_mock_response([])
 
-    await client.discover(requirements=["web_search", "translation"])
+    await registry_client.discover(requirements=["web_search", "translation"])
 
-    client._client.get.assert_called_once()
-    call_kwargs = client._client.get.call_args
+    registry_client._client.get.assert_called_once()
+    call_kwargs = registry_client._client.get.call_args
     url = call_kwargs[0][0]
     # No requirements/include_schemas params sent to the service
     params = call_kwargs[1].get("params", {})
@@ -110,9 +98,8 @@ async def test_discover_calls_discover_endpoint_without_filter_params():
 
 
 @pytest.mark.asyncio
-async def test_discover_filters_by_task_name_client_side():
+async def test_discover_filters_by_task_name_client_side(registry_client):
     """discover(requirements=[...]) returns only agents whose capability task_name matches."""
-    client = _make_registry_client()
     matching = _sample_agent_dict("SearchWorker:1.0.0")   # task_name=web_search
     non_matching = dict(_sample_agent_dict("OtherWorker:1.0.0"))  # will be patched
     non_matching["agentId"] = "other-001"
@@ -124,9 +111,9 @@ async def test_discover_filters_by_task_name_client_side():
             "producedEvents": [],
         }
     ]
-    client._client.get.return_value = _make_agent_mock_response([matching, non_matching])
+    registry_client._client.get.return_value = _make_agent_mock_response([matching, non_matching])
 
-    result = await client.discover(requirements=["web_search"])
+    result = await registry_client.discover(requirements=["web_search"])
 
     # Only the agent with task_name containing "web_search" should be returned
     assert len(result) == 1
@@ -134,25 +121,23 @@ async def test_discover_filters_by_task_name_client_side():
 
 
 @pytest.mark.asyncio
-async def test_discover_empty_result():
+async def test_discover_empty_result(registry_client):
     """discover() handles empty list response gracefully."""
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response([])
+    registry_client._client.get.return_value = _make_agent_mock_response([])
 
-    result = await client.discover(requirements=["unknown_capability"])
+    result = await registry_client.discover(requirements=["unknown_capability"])
 
     assert result == []
 
 
 @pytest.mark.asyncio
-async def test_discover_maps_agent_definition_to_discovered_agent():
+async def test_discover_maps_agent_definition_to_discovered_agent(registry_client):
     """discover() maps AgentDefinition fields into DiscoveredAgent correctly."""
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response(
+    registry_client._client.get.return_value = _make_agent_mock_response(
         [_sample_agent_dict("SearchWorker:2.1.0")]
     )
 
-    result = await client.discover(requirements=["web_search"])
+    result = await registry_client.discover(requirements=["web_search"])
 
     assert len(result) == 1
     agent = result[0]
@@ -163,14 +148,13 @@ async def test_discover_maps_agent_definition_to_discovered_agent():
 
 
 @pytest.mark.asyncio
-async def test_discover_parses_version_from_name():
+async def test_discover_parses_version_from_name(registry_client):
     """discover() extracts version from 'Name:version' convention."""
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response(
+    registry_client._client.get.return_value = _make_agent_mock_response(
         [_sample_agent_dict("SearchWorker:1.0.0")]
     )
 
-    result = await client.discover(requirements=["web_search"])
+    result = await registry_client.discover(requirements=["web_search"])
 
     agent = result[0]
     assert agent.name == "SearchWorker"
@@ -178,14 +162,13 @@ async def test_discover_parses_version_from_name():
 
 
 @pytest.mark.asyncio
-async def test_discover_defaults_version_when_no_suffix():
+async def test_discover_defaults_version_when_no_suffix(registry_client):
     """discover() defaults version to '1.0.0' when name has no ':version' suffix."""
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response(
+    registry_client._client.get.return_value = _make_agent_mock_response(
         [_sample_agent_dict("SearchWorker")]  # no version suffix
     )
 
-    result = await client.discover(requirements=["web_search"])
+    result = await registry_client.discover(requirements=["web_search"])
 
     agent = result[0]
     assert agent.name == "SearchWorker"
@@ -197,14 +180,13 @@ async def test_discover_defaults_version_when_no_suffix():
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_discover_agents_returns_discovered_agent_list():
+async def test_discover_agents_returns_discovered_agent_list(registry_client):
     """discover_agents() returns List[DiscoveredAgent], not List[AgentDefinition]."""
-    client = _make_registry_client()
-    client._client.get.return_value = _make_agent_mock_response(
+    registry_client._client.get.return_value = _make_agent_mock_response(
         [_sample_agent_dict()]
     )
 
-    result = await client.discover_agents()
+    result = await registry_client.discover_agents()
 
     assert isinstance(result, list)
     assert len(result) == 1
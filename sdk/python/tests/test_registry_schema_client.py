@@ -10,9 +10,11 @@ Run:
     pytest sdk/python/tests/test_registry_schema_client.py -v
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, Mock
 
 from soorma.registry.client import RegistryClient
+
+from ._helpers import json_response
 from soorma_common import PayloadSchema
 
 
@@ -20,12 +22,6 @@ from soorma_common import PayloadSchema
 # Fixtures / helpers
 # ---------------------------------------------------------------------------
 
-def _make_registry_client() -> RegistryClient:
-    """Return a RegistryClient with a mocked async HTTP client."""
-    client = RegistryClient(base_url="http://test-registry")
-    client._client = AsyncMock()
-    return client
-
 
 def _sample_schema_dict(
     name: str = "research_request_v1",
@@ -43,46 +39,37 @@ def _sample_schema_dict(
     }
 
 
-def _make_schema_response(schema_dict: dict) -> MagicMock:
+def _make_schema_response(schema_dict: dict) -> Mock:
     """Build a 200 HTTP mock response containing a single PayloadSchema dict."""
-    resp = MagicMock()
-    resp.status_code = 200
-    resp.json.return_value = schema_dict
-    resp.raise_for_status = MagicMock()
-    return resp
+    return json_response(schema_dict)
 
 
 def _make_schema_register_response(
     name: str = "research_request_v1",
     version: str = "1.0.0",
-) -> MagicMock:
+) -> Mock:
     """Build a 201 HTTP mock for schema registration (PayloadSchemaResponse shape)."""
-    resp = MagicMock()
-    resp.status_code = 201
-    resp.json.return_value = {
-        "schemaName": name,
-        "version": version,
-        "success": True,
-        "message": "Schema registered successfully",
-    }
-    resp.raise_for_status = MagicMock()
-    return resp
+    return json_response(
+        {
+            "schemaName": name,
+            "version": version,
+            "success": True,
+            "message": "Schema registered successfully",
+        },
+        status_code=201,
+    )
 
 
-def _make_schema_list_response(schemas: list) -> MagicMock:
+def _make_schema_list_response(schemas: list) -> Mock:
     """Build a 200 HTTP mock returning a PayloadSchemaListResponse-shaped dict."""
-    resp = MagicMock()
-    resp.status_code = 200
-    resp.json.return_value = {"schemas": schemas, "count": len(schemas)}
-    resp.raise_for_status = MagicMock()
-    return resp
+    return json_response({"schemas": schemas, "count": len(schemas)})
 
 
-def _make_404_response() -> MagicMock:
+def _make_404_response() -> Mock:
     """Build a 404 HTTP mock response."""
-    resp = MagicMock()
+    resp = Mock()
     resp.status_code = 404
-    resp.raise_for_status = MagicMock()
+    resp.raise_for_status = Mock()
     return resp
 
 
@@ -105,32 +92,30 @@ def _sample_payload_schema(
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_register_schema_posts_to_correct_url() -> None:
+async def test_register_schema_posts_to_correct_url(registry_client: RegistryClient) -> None:
     """register_schema() should POST to /v1/schemas."""
-    registry = _make_registry_client()
-    registry._client.post = AsyncMock(
+    registry_client._client.post = AsyncMock(
         return_value=_make_schema_register_response()
     )
 
     schema = _sample_payload_schema()
-    await registry.register_schema(schema)
+    await registry_client.register_schema(schema)
 
-    call_kwargs = registry._client.post.call_args
+    call_kwargs = registry_client._client.post.call_args
     assert "/v1/schemas" in call_kwargs.args[0]
 
 
 @pytest.mark.asyncio
-async def test_register_schema_sends_schema_in_envelope() -> None:
+async def test_register_schema_sends_schema_in_envelope(registry_client: RegistryClient) -> None:
     """register_schema() should wrap schema under 'schema' key (camelCase alias)."""
-    registry = _make_registry_client()
-    registry._client.post = AsyncMock(
+    registry_client._client.post = AsyncMock(
         return_value=_make_schema_register_response()
     )
 
     schema = _sample_payload_schema()
-    await registry.register_schema(schema)
+    await registry_client.register_schema(schema)
 
-    call_kwargs = registry._client.post.call_args
+    call_kwargs = registry_client._client.post.call_args
     body: dict = call_kwargs.kwargs["json"]
     # Payload should be wrapped in 'schema' envelope key
     assert "schema" in body
@@ -141,16 +126,15 @@ async def test_register_schema_sends_schema_in_envelope() -> None:
 
 
 @pytest.mark.asyncio
-async def test_register_schema_returns_payload_schema_response() -> None:
+async def test_register_schema_returns_payload_schema_response(registry_client: RegistryClient) -> None:
     """register_schema() should return a PayloadSchemaResponse with success=True."""
     from soorma_common import PayloadSchemaResponse  # type: ignore[attr-defined]
 
-    registry = _make_registry_client()
-    registry._client.post = AsyncMock(
+    registry_client._client.post = AsyncMock(
         return_value=_make_schema_register_response()
     )
 
-    result = await registry.register_schema(_sample_payload_schema())
+    result = await registry_client.register_schema(_sample_payload_schema())
 
     assert isinstance(result, PayloadSchemaResponse)
     assert result.success is True
@@ -162,44 +146,41 @@ async def test_register_schema_returns_payload_schema_response() -> None:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_get_schema_latest_version_calls_name_url() -> None:
+async def test_get_schema_latest_version_calls_name_url(registry_client: RegistryClient) -> None:
     """get_schema(name) without version should call GET /v1/schemas/{name}."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_response(_sample_schema_dict())
     )
 
-    await registry.get_schema("research_request_v1")
+    await registry_client.get_schema("research_request_v1")
 
-    call_url = registry._client.get.call_args.args[0]
+    call_url = registry_client._client.get.call_args.args[0]
     assert call_url.endswith("/v1/schemas/research_request_v1")
     # Must NOT contain 'versions' segment
     assert "versions" not in call_url
 
 
 @pytest.mark.asyncio
-async def test_get_schema_specific_version_calls_versioned_url() -> None:
+async def test_get_schema_specific_version_calls_versioned_url(registry_client: RegistryClient) -> None:
     """get_schema(name, version) should call GET /v1/schemas/{name}/versions/{ver}."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_response(_sample_schema_dict(version="2.0.0"))
     )
 
-    await registry.get_schema("research_request_v1", version="2.0.0")
+    await registry_client.get_schema("research_request_v1", version="2.0.0")
 
-    call_url = registry._client.get.call_args.args[0]
+    call_url = registry_client._client.get.call_args.args[0]
     assert "research_request_v1/versions/2.0.0" in call_url
 
 
 @pytest.mark.asyncio
-async def test_get_schema_returns_payload_schema_dto() -> None:
+async def test_get_schema_returns_payload_schema_dto(registry_client: RegistryClient) -> None:
     """get_schema() should return a PayloadSchema DTO on success."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_response(_sample_schema_dict())
     )
 
-    result = await registry.get_schema("research_request_v1")
+    result = await registry_client.get_schema("research_request_v1")
 
     assert isinstance(result, PayloadSchema)
     assert result.schema_name == "research_request_v1"
@@ -207,12 +188,11 @@ async def test_get_schema_returns_payload_schema_dto() -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_schema_returns_none_on_404() -> None:
+async def test_get_schema_returns_none_on_404(registry_client: RegistryClient) -> None:
     """get_schema() should return None (not raise) when the service returns 404."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(return_value=_make_404_response())
+    registry_client._client.get = AsyncMock(return_value=_make_404_response())
 
-    result = await registry.get_schema("nonexistent_schema")
+    result = await registry_client.get_schema("nonexistent_schema")
 
     assert result is None
 
@@ -222,61 +202,57 @@ async def test_get_schema_returns_none_on_404() -> None:
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_list_schemas_calls_schemas_endpoint() -> None:
+async def test_list_schemas_calls_schemas_endpoint(registry_client: RegistryClient) -> None:
     """list_schemas() should call GET /v1/schemas."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_list_response([_sample_schema_dict()])
     )
 
-    await registry.list_schemas()
+    await registry_client.list_schemas()
 
-    call_url = registry._client.get.call_args.args[0]
+    call_url = registry_client._client.get.call_args.args[0]
     assert call_url.endswith("/v1/schemas")
 
 
 @pytest.mark.asyncio
-async def test_list_schemas_with_owner_filter_passes_param() -> None:
+async def test_list_schemas_with_owner_filter_passes_param(registry_client: RegistryClient) -> None:
     """list_schemas(owner_agent_id) should include owner_agent_id as a query param."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_list_response([])
     )
 
-    await registry.list_schemas(owner_agent_id="search-worker-001")
+    await registry_client.list_schemas(owner_agent_id="search-worker-001")
 
-    call_kwargs = registry._client.get.call_args.kwargs
+    call_kwargs = registry_client._client.get.call_args.kwargs
     assert call_kwargs.get("params", {}).get("owner_agent_id") == "search-worker-001"
 
 
 @pytest.mark.asyncio
-async def test_list_schemas_no_filter_sends_empty_params() -> None:
+async def test_list_schemas_no_filter_sends_empty_params(registry_client: RegistryClient) -> None:
     """list_schemas() without filter should NOT pass owner_agent_id as query param."""
-    registry = _make_registry_client()
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_list_response([])
     )
 
-    await registry.list_schemas()
+    await registry_client.list_schemas()
 
-    call_kwargs = registry._client.get.call_args.kwargs
+    call_kwargs = registry_client._client.get.call_args.kwargs
     params = call_kwargs.get("params", {})
     assert "owner_agent_id" not in params
 
 
 @pytest.mark.asyncio
-async def test_list_schemas_returns_list_of_payload_schemas() -> None:
+async def test_list_schemas_returns_list_of_payload_schemas(registry_client: RegistryClient) -> None:
     """list_schemas() should return a list of PayloadSchema DTOs."""
-    registry = _make_registry_client()
     schema_dicts = [
         _sample_schema_dict(name="schema_a_v1", version="1.0.0"),
         _sample_schema_dict(name="schema_b_v2", version="2.0.0"),
     ]
-    registry._client.get = AsyncMock(
+    registry_client._client.get = AsyncMock(
         return_value=_make_schema_list_response(schema_dicts)
     )
 
-    results = await registry.list_schemas()
+    results = await registry_client.list_schemas()
 
     assert isinstance(results, list)
     assert len(results) == 2
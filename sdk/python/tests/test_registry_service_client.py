@@ -2,29 +2,25 @@
 Tests for the full RegistryClient (soorma.registry.client).
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from soorma.registry.client import RegistryClient
 from soorma_common import EventDefinition
 
+from ._helpers import json_response
+
+
 @pytest.mark.asyncio
-async def test_register_event_structured():
+async def test_register_event_structured(registry_client):
     """
     Test registering an event with structured definition.
     """
-    mock_client = AsyncMock()
-    mock_response = MagicMock()
-    mock_response.status_code = 200
     # Mock response for EventRegistrationResponse
-    mock_response.json.return_value = {
+    mock_response = json_response({
         "eventName": "test.event",
         "success": True,
         "message": "Registered successfully"
-    }
+    })
+    mock_client = registry_client._client
     mock_client.post.return_value = mock_response
 
-    client = RegistryClient(base_url="http://test-registry")
-    client._client = mock_client
-
     # Create structured event definition
     event_def = EventDefinition(
         event_name="test.event",
@@ -46,7 +42,7 @@ async def test_register_event_structured():
     )
 
     # Register event
-    response = await client.register_event(event_def)
+    response = await registry_client.register_event(event_def)
 
     assert response.success is True
     assert response.event_name == "test.event"
@@ -69,21 +65,19 @@ async def test_register_event_structured():
 
 
 @pytest.mark.asyncio
-async def test_registry_client_includes_bearer_auth_when_configured():
+async def test_registry_client_includes_bearer_auth_when_configured(registry_client):
     """RegistryClient should include Authorization header when auth_token is set."""
-    client = RegistryClient(base_url="http://test-registry", auth_token="jwt-token")
+    registry_client.set_auth_token("jwt-token")
 
-    headers = await client._build_auth_headers()
+    headers = await registry_client._build_auth_headers()
 
     assert headers["Authorization"] == "Bearer jwt-token"
     assert "X-Tenant-ID" not in headers
 
 
 @pytest.mark.asyncio
-async def test_registry_client_omits_auth_headers_when_unconfigured():
+async def test_registry_client_omits_auth_headers_when_unconfigured(registry_client):
     """RegistryClient should not infer auth from environment or header fallbacks."""
-    client = RegistryClient(base_url="http://test-registry")
-
-    headers = await client._build_auth_headers()
+    headers = await registry_client._build_auth_headers()
 
     assert headers == {}
@@ -7,8 +7,13 @@ Test coverage for:
 - Multi-level delegation chains
 - End-to-end workflows
 """
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 from types import SimpleNamespace
 
 from soorma_common.events import EventEnvelope, EventTopic
@@ -58,17 +63,25 @@ async def test_tool_delegates_to_worker():
         response_event="add.numbers.result",
     )
 
-    context = MagicMock()
-    context.memory = AsyncMock()
-    context.bus = AsyncMock()
+    context = SimpleNamespace(
+        memory=AsyncMock(),
+        bus=AsyncMock(),
+        logger=logging.getLogger("test"),
+    )
+    bus_requests = []
+
+    async def fake_request(**kwargs):
+        bus_requests.append(kwargs)
+
+    context.bus.request = fake_request
 
     # Call tool handler
     tool_wrapper = tool._event_handlers["action-requests:add.numbers"][0]
     await tool_wrapper(tool_event, context)
 
     # Verify tool published request to worker
-    context.bus.request.assert_awaited_once()
-    call_kwargs = context.bus.request.await_args.kwargs
+    assert len(bus_requests) == 1
+    call_kwargs = bus_requests[0]
     assert call_kwargs["event_type"] == "compute.sum.requested"
     assert call_kwargs["response_event"] == "compute.sum.completed"
 
@@ -79,7 +92,6 @@ async def test_tool_receives_worker_result():
     tool = Tool(name="data-tool")
     worker = Worker(name="processor-worker")
 
-    # Track flow
     flow = {"tool_invoked": False, "worker_processed": False, "tool_received": False}
 
     @tool.on_invoke("process.data")
@@ -105,9 +117,11 @@ async def test_tool_receives_worker_result():
         flow["tool_received"] = True
         return {"final_result": request.data["result"]}
 
-    context = MagicMock()
-    context.memory = AsyncMock()
-    context.bus = AsyncMock()
+    context = SimpleNamespace(
+        memory=AsyncMock(),
+        bus=AsyncMock(),
+        logger=logging.getLogger("test"),
+    )
 
     # Tool invocation
     tool_event = EventEnvelope(
@@ -133,8 +147,20 @@ async def test_tool_receives_worker_result():
     worker_wrapper = worker._event_handlers["action-requests:process.data.requested"][0]
     await worker_wrapper(worker_event, context)
 
+    # Deliver the worker's result back to the tool
+    result_event = EventEnvelope(
+        source="processor-worker",
+        type="process.data.result",
+        topic=EventTopic.ACTION_REQUESTS,
+        data={"request_id": "req-2", "result": "processed"},
+    )
+
+    result_wrapper = tool._event_handlers["action-requests:process.data.result"][0]
+    await result_wrapper(result_event, context)
+
     assert flow["tool_invoked"] is True
     assert flow["worker_processed"] is True
+    assert flow["tool_received"] is True
 
 
 # ==============================================================================
@@ -164,9 +190,17 @@ async def test_worker_delegates_to_worker():
         flow["processor_called"] = True
         await task.complete({"status": "done"})
 
-    context = MagicMock()
-    context.memory = AsyncMock()
-    context.bus = AsyncMock()
+    context = SimpleNamespace(
+        memory=AsyncMock(),
+        bus=AsyncMock(),
+        logger=logging.getLogger("test"),
+    )
+    bus_requests = []
+
+    async def fake_request(**kwargs):
+        bus_requests.append(kwargs)
+
+    context.bus.request = fake_request
 
     # Coordinator receives task
     coord_event = EventEnvelope(
@@ -182,7 +216,7 @@ async def test_worker_delegates_to_worker():
 
     assert flow["coordinator_called"] is True
     # Verify delegation
-    context.bus.request.assert_awaited_once()
+    assert len(bus_requests) == 1
 
 
 @pytest.mark.asyncio
@@ -192,11 +226,12 @@ async def test_multi_level_delegation():
     level2 = Worker(name="level2")
     level3 = Worker(name="level3")
 
-    delegation_depth = {"level": 0}
+    delegation_depth = 0
 
     @level1.on_task("task.level1")
     async def handle_level1(task: TaskContext, context):
-        delegation_depth["level"] = 1
+        nonlocal delegation_depth
+        delegation_depth = 1
         await task.delegate(
             event_type="task.level2",
             data={},
@@ -205,7 +240,8 @@ async def test_multi_level_delegation():
 
     @level2.on_task("task.level2")
     async def handle_level2(task: TaskContext, context):
-        delegation_depth["level"] = 2
+        nonlocal delegation_depth
+        delegation_depth = 2
         await task.delegate(
             event_type="task.level3",
             data={},
@@ -214,12 +250,21 @@ async def test_multi_level_delegation():
 
     @level3.on_task("task.level3")
     async def handle_level3(task: TaskContext, context):
-        delegation_depth["level"] = 3
+        nonlocal delegation_depth
+        delegation_depth = 3
         await task.complete({"result": "done"})
 
-    context = MagicMock()
-    context.memory = AsyncMock()
-    context.bus = AsyncMock()
+    context = SimpleNamespace(
+        memory=AsyncMock(),
+        bus=AsyncMock(),
+        logger=logging.getLogger("test"),
+    )
+
+    # Resolve each hop's handler once, up front
+    handlers = {
+        lvl: worker._event_handlers[f"action-requests:task.level{lvl}"][0]
+        for lvl, worker in zip((1, 2, 3), (level1, level2, level3))
+    }
 
     # Start chain at level 1
     event = EventEnvelope(
@@ -230,13 +275,27 @@ async def test_multi_level_delegation():
         response_event="task.level1.completed",
     )
 
-    wrapper = level1._event_handlers["action-requests:task.level1"][0]
-    await wrapper(event, context)
+    await handlers[1](event, context)
 
     # Level 1 should have delegated
-    assert delegation_depth["level"] == 1
+    assert delegation_depth == 1
     context.bus.request.assert_awaited()
 
+    # Walk the remaining hops of the chain
+    for lvl in (2, 3):
+        hop_event = EventEnvelope(
+            source=f"level{lvl - 1}",
+            type=f"task.level{lvl}",
+            topic=EventTopic.ACTION_REQUESTS,
+            data={"task_id": f"multi-level-{lvl}"},
+            response_event=f"task.level{lvl}.completed",
+        )
+        await handlers[lvl](hop_event, context)
+        assert delegation_depth == lvl
+
+    # Levels 1 and 2 delegated, level 3 completed
+    assert context.bus.request.await_count == 2
+
 
 @pytest.mark.asyncio
 @pytest.mark.skip(reason="Loop detection in Stage 4 (Planner)")
@@ -251,23 +310,58 @@ async def test_delegation_loop_detection():
 # ==============================================================================
 
 
-@pytest.mark.asyncio
-async def test_complete_order_processing():
-    """Simulate 08-worker-basic order processing workflow."""
+@dataclass(slots=True)
+class _TaskShim:
+    """Stored task record as returned by memory.get_task_by_subtask."""
+
+    task_id: str
+    plan_id: str | None
+    event_type: str
+    response_event: str
+    response_topic: str
+    data: dict
+    sub_tasks: list
+    state: dict
+    tenant_id: str | None
+    user_id: str | None
+
+
+# Stored order task returned by get_task_by_subtask; fields are shared read-only
+_ORDER_TASK_TEMPLATE = _TaskShim(
+    task_id="order-1",
+    plan_id=None,
+    event_type="order.process.requested",
+    response_event="order.process.completed",
+    response_topic="action-results",
+    data={},
+    sub_tasks=["sub-1", "sub-2"],
+    state={},
+    tenant_id=None,
+    user_id=None,
+)
+
+
+def _restore_order_task(*_args, **_kwargs):
+    """Return a shallow copy of the order task with its own mutable state."""
+    task = copy.copy(_ORDER_TASK_TEMPLATE)
+    task.state = {"_sub_tasks": {}}
+    return task
+
+
+@pytest.fixture(scope="module")
+def order_workers():
+    """Order, inventory and payment workers with handlers registered once.
+
+    Handlers record progress in ``context.workflow_state``, so each test
+    supplies its own state dict through the context it dispatches with.
+    """
     order_worker = Worker(name="order-processor")
     inventory_worker = Worker(name="inventory-service")
     payment_worker = Worker(name="payment-service")
 
-    workflow_state = {
-        "order_received": False,
-        "inventory_reserved": False,
-        "payment_processed": False,
-        "order_completed": False,
-    }
-
     @order_worker.on_task("order.process.requested")
     async def process_order(task: TaskContext, context):
-        workflow_state["order_received"] = True
+        context.workflow_state["order_received"] = True
         # Parallel delegation
         await task.delegate_parallel([
             DelegationSpec("inventory.reserve.requested", {}, "inventory.reserve.completed"),
@@ -276,12 +370,12 @@ async def test_complete_order_processing():
 
     @inventory_worker.on_task("inventory.reserve.requested")
     async def reserve_inventory(task: TaskContext, context):
-        workflow_state["inventory_reserved"] = True
+        context.workflow_state["inventory_reserved"] = True
         await task.complete({"reserved": True})
 
     @payment_worker.on_task("payment.process.requested")
     async def process_payment(task: TaskContext, context):
-        workflow_state["payment_processed"] = True
+        context.workflow_state["payment_processed"] = True
         await task.complete({"charged": True})
 
     @order_worker.on_result("inventory.reserve.completed")
@@ -291,25 +385,40 @@ async def test_complete_order_processing():
         if task:
             task.update_sub_task_result(result.correlation_id, result.data)
             # Check if all results arrived (simplified)
-            workflow_state["order_completed"] = True
+            context.workflow_state["order_completed"] = True
+
+    return {
+        "order": order_worker,
+        "inventory": inventory_worker,
+        "payment": payment_worker,
+    }
 
-    context = MagicMock()
-    context.memory = AsyncMock()
-    context.bus = AsyncMock()
+
+@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="e2e_order")
+async def test_complete_order_processing(order_workers):
+    """Simulate 08-worker-basic order processing workflow."""
+    workflow_state = {
+        "order_received": False,
+        "inventory_reserved": False,
+        "payment_processed": False,
+        "order_completed": False,
+    }
+
+    # Resolve handler wrappers once, up front
+    order_wrapper = order_workers["order"]._event_handlers["action-requests:order.process.requested"][0]
+    inv_wrapper = order_workers["inventory"]._event_handlers["action-requests:inventory.reserve.requested"][0]
+    pay_wrapper = order_workers["payment"]._event_handlers["action-requests:payment.process.requested"][0]
+
+    context = SimpleNamespace(
+        memory=AsyncMock(),
+        bus=AsyncMock(),
+        logger=logging.getLogger("test"),
+        workflow_state=workflow_state,
+    )
 
     # Mock task restoration
-    context.memory.get_task_by_subtask = AsyncMock(return_value=SimpleNamespace(
-        task_id="order-1",
-        plan_id=None,
-        event_type="order.process.requested",
-        response_event="order.process.completed",
-        response_topic="action-results",
-        data={},
-        sub_tasks=["sub-1", "sub-2"],
-        state={"_sub_tasks": {}},
-        tenant_id=None,
-        user_id=None,
-    ))
+    context.memory.get_task_by_subtask = AsyncMock(side_effect=_restore_order_task)
 
     # Start workflow
     order_event = EventEnvelope(
@@ -320,9 +429,6 @@ async def test_complete_order_processing():
         response_event="order.process.completed",
     )
 
-    order_wrapper = order_worker._event_handlers["action-requests:order.process.requested"][0]
-    await order_wrapper(order_event, context)
-
     # Simulate inventory completion
     inventory_event = EventEnvelope(
         source="inventory-service",
@@ -332,9 +438,6 @@ async def test_complete_order_processing():
         response_event="inventory.reserve.completed",
     )
 
-    inv_wrapper = inventory_worker._event_handlers["action-requests:inventory.reserve.requested"][0]
-    await inv_wrapper(inventory_event, context)
-
     # Simulate payment completion
     payment_event = EventEnvelope(
         source="payment-service",
@@ -344,8 +447,13 @@ async def test_complete_order_processing():
         response_event="payment.process.completed",
     )
 
-    pay_wrapper = payment_worker._event_handlers["action-requests:payment.process.requested"][0]
-    await pay_wrapper(payment_event, context)
+    await order_wrapper(order_event, context)
+
+    # Inventory and payment are independent workers; run them concurrently
+    await asyncio.gather(
+        inv_wrapper(inventory_event, context),
+        pay_wrapper(payment_event, context),
+    )
 
     # Verify workflow progression
     assert workflow_state["order_received"] is True
@@ -354,6 +462,7 @@ async def test_complete_order_processing():
 
 
 @pytest.mark.asyncio
+@pytest.mark.xdist_group(name="e2e_validate")
 async def test_parallel_aggregation_e2e():
     """Test parallel fan-out/fan-in with result aggregation."""
     orchestrator = Worker(name="validator")
@@ -399,12 +508,16 @@ async def test_parallel_aggregation_e2e():
                 # All results collected
                 all_valid = all(r.get("valid", False) for r in aggregated.values())
 
-    context = MagicMock()
-    context.memory = AsyncMock()
-    context.bus = AsyncMock()
+    validate_wrapper = orchestrator._event_handlers["action-requests:validate.all"][0]
+
+    context = SimpleNamespace(
+        memory=AsyncMock(),
+        bus=AsyncMock(),
+        logger=logging.getLogger("test"),
+    )
 
     # Mock task restoration
-    task_data = SimpleNamespace(
+    task_data = _TaskShim(
         task_id="validate-1",
         plan_id=None,
         event_type="validate.all",
@@ -434,7 +547,6 @@ async def test_parallel_aggregation_e2e():
         response_event="validate.all.completed",
     )
 
-    validate_wrapper = orchestrator._event_handlers["action-requests:validate.all"][0]
     await validate_wrapper(validate_event, context)
 
     # Verify parallel delegation occurred
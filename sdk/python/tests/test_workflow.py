@@ -1,237 +1,294 @@
-"""Tests for WorkflowState helper class."""
+"""Tests for WorkflowState helper class.
+
+Every test runs against two memory backends:
+
+- ``retrieve_store``: a bare MemoryClient mock exposing ``retrieve``/``store``
+- ``plan_state``: a real ``context.MemoryClient`` over a mocked Memory Service
+  client exposing ``get_plan_state``/``set_plan_state``
+"""
+
+from types import MappingProxyType
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, call
+from soorma.context import MemoryClient
 from soorma.workflow import WorkflowState
+from soorma_common.models import WorkingMemoryResponse
 
+# All tests in this module share one event loop, so no test pays for
+# creating and closing its own. Tests still run one after another: each
+# mutates the pooled backend's mocks, so they are not gathered concurrently.
+pytestmark = pytest.mark.asyncio(scope="module")
+
+# Identity every WorkflowState in this module is bound to
+_IDS = MappingProxyType({
+    "plan_id": "plan-123",
+    "tenant_id": "test-tenant",
+    "user_id": "test-user",
+})
+
+# The same identity as the Memory Service client receives it
+_SERVICE_IDS = MappingProxyType({
+    "service_tenant_id": _IDS["tenant_id"],
+    "service_user_id": _IDS["user_id"],
+})
+
+
+def _wmr(key, value):
+    """Build a WorkingMemoryResponse without running pydantic validation."""
+    return WorkingMemoryResponse.model_construct(
+        id="1",
+        tenant_id="tenant-1",
+        plan_id=_IDS["plan_id"],
+        key=key,
+        value=value,
+        updated_at="2026-01-21T00:00:00Z",
+    )
+
+
+class _RetrieveStoreBackend:
+    """WorkflowState backed directly by a mocked retrieve/store MemoryClient."""
+
+    name = "retrieve_store"
+
+    def __init__(self):
+        self.client = AsyncMock()
+        self.memory = self.client
+
+    @staticmethod
+    def store_call(key, value):
+        return call(key, value, **_IDS)
+
+    def reset(self):
+        self.client.reset_mock(return_value=True, side_effect=True)
+
+    def expect_get(self, key, value):
+        self.client.retrieve.return_value = value
+
+    def assert_retrieved(self, key):
+        self.client.retrieve.assert_called_once_with(key, **_IDS)
+
+    def assert_stored(self, key, value):
+        self.assert_store_call(self.store_call(key, value))
+
+    def assert_store_call(self, expected):
+        assert self.client.store.call_count == 1
+        assert self.client.store.call_args == expected
+
+
+class _PlanStateBackend:
+    """WorkflowState backed by context.MemoryClient over a mocked service client."""
+
+    name = "plan_state"
+
+    def __init__(self):
+        self.client = AsyncMock()
+        self.memory = MemoryClient()
+        self.memory._client = self.client
+
+    @staticmethod
+    def store_call(key, value):
+        return call(_IDS["plan_id"], key, value, **_SERVICE_IDS)
+
+    def reset(self):
+        self.client.reset_mock(return_value=True, side_effect=True)
+
+    def expect_get(self, key, value):
+        if value is None:
+            # Memory Service reports missing keys as 404
+            self.client.get_plan_state.side_effect = Exception("404")
+            return
+        self.client.get_plan_state.side_effect = None
+        self.client.get_plan_state.return_value = _wmr(key, value)
+
+    def assert_retrieved(self, key):
+        self.client.get_plan_state.assert_called_once_with(
+            _IDS["plan_id"], key, **_SERVICE_IDS
+        )
+
+    def assert_stored(self, key, value):
+        self.assert_store_call(self.store_call(key, value))
+
+    def assert_store_call(self, expected):
+        assert self.client.set_plan_state.call_count == 1
+        assert self.client.set_plan_state.call_args == expected
 
-@pytest.fixture
-def mock_memory_client():
-    """Create a mock MemoryClient."""
-    client = AsyncMock()
-    return client
+
+_BACKENDS = {
+    backend_cls.name: backend_cls
+    for backend_cls in (_RetrieveStoreBackend, _PlanStateBackend)
+}
+
+# Expected action-history writes, built once per backend at import time
+_EXPECTED_STORE_NEW = {
+    name: backend_cls.store_call("_action_history", {"actions": ["research.started"]})
+    for name, backend_cls in _BACKENDS.items()
+}
+_EXPECTED_STORE_EXISTING = {
+    name: backend_cls.store_call(
+        "_action_history",
+        {"actions": ["research.started", "research.completed"]},
+    )
+    for name, backend_cls in _BACKENDS.items()
+}
+
+
+@pytest.fixture(scope="module")
+def _memory_backend_pool():
+    """One instance of each backend, built once and reused by every test."""
+    return {name: backend_cls() for name, backend_cls in _BACKENDS.items()}
+
+
+@pytest.fixture(params=sorted(_BACKENDS))
+def memory_backend(request, _memory_backend_pool):
+    """Memory backend adapter exposing expect_get/assert_* helpers.
+
+    Mocks are reset (including return values and side effects) before each
+    test, so pooled instances never leak configuration between tests.
+    """
+    backend = _memory_backend_pool[request.param]
+    backend.reset()
+    return backend
+
+
+def _make_state(backend):
+    """Create a WorkflowState bound to the given backend."""
+    return WorkflowState(backend.memory, **_IDS)
 
 
 @pytest.fixture
-def workflow_state(mock_memory_client):
+def workflow_state(memory_backend):
     """Create a WorkflowState instance."""
-    return WorkflowState(
-        mock_memory_client, 
-        "plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user"
-    )
+    return _make_state(memory_backend)
 
 
-@pytest.mark.asyncio
-async def test_record_action_new_history(workflow_state, mock_memory_client):
+async def test_record_action_new_history(workflow_state, memory_backend):
     """Test recording action with new history."""
-    # Mock retrieve to return None (key doesn't exist)
-    mock_memory_client.retrieve.return_value = None
-    
+    # Key doesn't exist yet
+    memory_backend.expect_get("_action_history", None)
+
     await workflow_state.record_action("research.started")
-    
-    # Verify retrieve was called
-    mock_memory_client.retrieve.assert_called_once_with(
-        "_action_history",
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
-    
-    # Verify store was called with correct data
-    mock_memory_client.store.assert_called_once_with(
-        "_action_history",
-        {"actions": ["research.started"]},
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
 
+    # Verify history was read, then stored with the new action
+    memory_backend.assert_retrieved("_action_history")
+    memory_backend.assert_store_call(_EXPECTED_STORE_NEW[memory_backend.name])
 
-@pytest.mark.asyncio
-async def test_record_action_existing_history(workflow_state, mock_memory_client):
+
+async def test_record_action_existing_history(workflow_state, memory_backend):
     """Test recording action with existing history."""
-    # Mock retrieve to return existing history
-    mock_memory_client.retrieve.return_value = {"actions": ["research.started"]}
-    
+    memory_backend.expect_get("_action_history", {"actions": ["research.started"]})
+
     await workflow_state.record_action("research.completed")
-    
-    # Verify store was called with updated history
-    mock_memory_client.store.assert_called_once_with(
-        "_action_history",
-        {"actions": ["research.started", "research.completed"]},
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
 
+    memory_backend.assert_store_call(_EXPECTED_STORE_EXISTING[memory_backend.name])
 
-@pytest.mark.asyncio
-async def test_get_action_history(workflow_state, mock_memory_client):
-    """Test getting action history."""
-    mock_memory_client.retrieve.return_value = {"actions": ["action1", "action2"]}
-    
-    history = await workflow_state.get_action_history()
-    
-    assert history == ["action1", "action2"]
-    mock_memory_client.retrieve.assert_called_once_with(
-        "_action_history",
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
 
+async def test_get_action_history(workflow_state, memory_backend):
+    """Test getting action history."""
+    memory_backend.expect_get("_action_history", {"actions": ["action1", "action2"]})
 
-@pytest.mark.asyncio
-async def test_get_action_history_empty(workflow_state, mock_memory_client):
-    """Test getting action history when none exists."""
-    mock_memory_client.retrieve.return_value = None
-    
     history = await workflow_state.get_action_history()
-    
-    assert history == []
 
+    assert history == ["action1", "action2"]
+    memory_backend.assert_retrieved("_action_history")
 
-@pytest.mark.asyncio
-async def test_set_and_get(workflow_state, mock_memory_client):
+
+async def test_set_and_get(workflow_state, memory_backend):
     """Test setting and getting a value."""
     await workflow_state.set("test_key", "test_value")
-    
-    # Verify store was called correctly
-    mock_memory_client.store.assert_called_once_with(
-        "test_key",
-        "test_value",
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
-    
-    # Mock retrieve
-    mock_memory_client.retrieve.return_value = "test_value"
-    
-    value = await workflow_state.get("test_key")
-    
-    assert value == "test_value"
-    mock_memory_client.retrieve.assert_called_once_with(
-        "test_key",
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
+    memory_backend.assert_stored("test_key", "test_value")
 
+    memory_backend.expect_get("test_key", "test_value")
+    value = await workflow_state.get("test_key")
 
-@pytest.mark.asyncio
-async def test_get_default(workflow_state, mock_memory_client):
-    """Test getting with default value."""
-    mock_memory_client.retrieve.return_value = None
-    
-    value = await workflow_state.get("missing_key", default="default_value")
-    
-    assert value == "default_value"
+    assert value == "test_value"
+    memory_backend.assert_retrieved("test_key")
 
 
-@pytest.mark.asyncio
-async def test_has(workflow_state, mock_memory_client):
+async def test_has(workflow_state, memory_backend):
     """Test checking if key exists."""
     # Key exists
-    mock_memory_client.retrieve.return_value = "some_value"
-    
-    exists = await workflow_state.has("existing_key")
-    assert exists is True
-    
+    memory_backend.expect_get("existing_key", "some_value")
+    assert await workflow_state.has("existing_key") is True
+
     # Key doesn't exist
-    mock_memory_client.retrieve.return_value = None
-    
-    exists = await workflow_state.has("missing_key")
-    assert exists is False
+    memory_backend.expect_get("missing_key", None)
+    assert await workflow_state.has("missing_key") is False
 
 
-@pytest.mark.asyncio
-async def test_increment(workflow_state, mock_memory_client):
+async def test_increment(workflow_state, memory_backend):
     """Test incrementing a counter."""
-    # Mock retrieve (existing counter)
-    mock_memory_client.retrieve.return_value = 5
-    
-    new_value = await workflow_state.increment("counter")
-    
-    assert new_value == 6
-    mock_memory_client.store.assert_called_once_with(
-        "counter",
-        6,
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
+    # Existing counter
+    memory_backend.expect_get("counter", 5)
 
+    new_value = await workflow_state.increment("counter")
 
-@pytest.mark.asyncio
-async def test_increment_new_counter(workflow_state, mock_memory_client):
-    """Test incrementing a new counter."""
-    # Mock retrieve (counter doesn't exist)
-    mock_memory_client.retrieve.return_value = None
-    
-    new_value = await workflow_state.increment("new_counter")
-    
-    assert new_value == 1
-    mock_memory_client.store.assert_called_once_with(
-        "new_counter",
-        1,
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
+    assert new_value == 6
+    memory_backend.assert_stored("counter", 6)
 
 
-@pytest.mark.asyncio
-async def test_append(workflow_state, mock_memory_client):
+async def test_append(workflow_state, memory_backend):
     """Test appending to a list."""
-    # Mock retrieve (existing list)
-    mock_memory_client.retrieve.return_value = ["item1", "item2"]
-    
+    # Existing list
+    memory_backend.expect_get("items", ["item1", "item2"])
+
     new_list = await workflow_state.append("items", "item3")
-    
+
     assert new_list == ["item1", "item2", "item3"]
-    mock_memory_client.store.assert_called_once_with(
-        "items",
-        ["item1", "item2", "item3"],
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
+    memory_backend.assert_stored("items", ["item1", "item2", "item3"])
 
 
-@pytest.mark.asyncio
-async def test_extend(workflow_state, mock_memory_client):
+async def test_extend(workflow_state, memory_backend):
     """Test extending a list."""
-    # Mock retrieve (existing list)
-    mock_memory_client.retrieve.return_value = ["item1"]
-    
+    # Existing list
+    memory_backend.expect_get("items", ["item1"])
+
     new_list = await workflow_state.extend("items", ["item2", "item3"])
-    
+
     assert new_list == ["item1", "item2", "item3"]
-    mock_memory_client.store.assert_called_once_with(
-        "items",
-        ["item1", "item2", "item3"],
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
+    memory_backend.assert_stored("items", ["item1", "item2", "item3"])
 
 
-@pytest.mark.asyncio
-async def test_update_dict(workflow_state, mock_memory_client):
+async def test_update_dict(workflow_state, memory_backend):
     """Test updating a dictionary."""
-    # Mock retrieve (existing dict)
-    mock_memory_client.retrieve.return_value = {"key1": "value1"}
-    
+    # Existing dict
+    memory_backend.expect_get("config", {"key1": "value1"})
+
     new_dict = await workflow_state.update_dict("config", {"key2": "value2"})
-    
+
     assert new_dict == {"key1": "value1", "key2": "value2"}
-    mock_memory_client.store.assert_called_once_with(
-        "config",
-        {"key1": "value1", "key2": "value2"},
-        plan_id="plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user",
-    )
+    memory_backend.assert_stored("config", {"key1": "value1", "key2": "value2"})
+
+
+# ---------------------------------------------------------------------------
+# Edge cases
+# ---------------------------------------------------------------------------
+
+
+async def test_get_action_history_empty(workflow_state, memory_backend):
+    """Test getting action history when none exists."""
+    memory_backend.expect_get("_action_history", None)
+
+    history = await workflow_state.get_action_history()
+
+    assert history == []
+
+
+async def test_get_default(workflow_state, memory_backend):
+    """Test getting with default value."""
+    memory_backend.expect_get("missing_key", None)
+
+    value = await workflow_state.get("missing_key", default="default_value")
+
+    assert value == "default_value"
+
+
+async def test_increment_new_counter(workflow_state, memory_backend):
+    """Test incrementing a new counter."""
+    # Counter doesn't exist
+    memory_backend.expect_get("new_counter", None)
+
+    new_value = await workflow_state.increment("new_counter")
+
+    assert new_value == 1
+    memory_backend.assert_stored("new_counter", 1)
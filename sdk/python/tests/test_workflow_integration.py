@@ -14,210 +14,103 @@ from soorma.workflow import WorkflowState
 from soorma.context import MemoryClient
 from soorma_common.models import WorkingMemoryResponse
 
-
-@pytest.fixture
-def mock_service_client():
-    """Create a mock Memory Service client."""
+# Validated once; tests derive responses with model_copy(update=...)
+_WMR_TEMPLATE = WorkingMemoryResponse(
+    id="1",
+    tenant_id="tenant-1",
+    plan_id="plan-123",
+    key="k",
+    value=None,
+    updated_at="2026-01-22T00:00:00Z",
+)
+
+# Keep this module on one pytest-xdist worker (-n auto --dist loadgroup) so
+# the module-scoped service stack is built once
+pytestmark = pytest.mark.xdist_group(name="workflow_integration")
+
+
+@pytest.fixture(scope="module")
+def _service_stack():
+    """Mocked service client wired into a real MemoryClient and WorkflowState.
+
+    Built once per module; see ``service_stack`` for per-test isolation.
+    """
     client = AsyncMock()
-    client.health = AsyncMock()
-    return client
-
-
-@pytest.mark.asyncio
-async def test_workflow_state_with_string_value(mock_service_client):
-    """Test WorkflowState.set() with string value."""
-    # Setup mock
-    mock_service_client.set_plan_state = AsyncMock()
-    mock_service_client.get_plan_state = AsyncMock(return_value=WorkingMemoryResponse(
-        id="1",
-        tenant_id="tenant-1",
-        plan_id="plan-123",
-        key="goal",
-        value="buy 100 bitcoins",  # Value stored directly
-        updated_at="2026-01-22T00:00:00Z",
-    ))
-    
-    # Create real instances with mocked service client
     memory_client = MemoryClient()
-    memory_client._client = mock_service_client
-    
+    memory_client._client = client
     state = WorkflowState(
-        memory_client, 
+        memory_client,
         "plan-123",
         tenant_id="test-tenant",
         user_id="test-user"
     )
-    
-    # Test: Set string value
-    await state.set("goal", "buy 100 bitcoins")
-    
-    # Verify: Raw value passed to set_plan_state (which wraps it internally)
-    mock_service_client.set_plan_state.assert_called_once_with(
-        "plan-123",
-        "goal",
-        "buy 100 bitcoins",  # Raw value, no wrapping in store()
-        service_tenant_id="test-tenant",
-        service_user_id="test-user",
-    )
-    
-    # Test: Get string value
-    result = await state.get("goal")
-    
-    # Verify: Value returned directly
-    assert result == "buy 100 bitcoins"
+    return client, memory_client, state
 
 
-@pytest.mark.asyncio
-async def test_workflow_state_with_integer_value(mock_service_client):
-    """Test WorkflowState.set() with integer value."""
-    mock_service_client.set_plan_state = AsyncMock()
-    mock_service_client.get_plan_state = AsyncMock(return_value=WorkingMemoryResponse(
-        id="1",
-        tenant_id="tenant-1",
-        plan_id="plan-123",
-        key="current_task_index",
-        value=0,
-        updated_at="2026-01-22T00:00:00Z",
-    ))
-    
-    memory_client = MemoryClient()
-    memory_client._client = mock_service_client
-    state = WorkflowState(
-        memory_client, 
-        "plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user"
-    )
-    
-    # Test: Set integer
-    await state.set("current_task_index", 0)
-    
-    # Verify: Raw value passed
-    mock_service_client.set_plan_state.assert_called_once_with(
-        "plan-123",
-        "current_task_index",
-        0,
-        service_tenant_id="test-tenant",
-        service_user_id="test-user",
-    )
-    
-    # Test: Get integer
-    result = await state.get("current_task_index")
-    assert result == 0
-
+@pytest.fixture
+def service_stack(_service_stack):
+    """Return ``(mock_service_client, memory_client, state)`` with fresh mocks.
 
-@pytest.mark.asyncio
-async def test_workflow_state_with_list_value(mock_service_client):
-    """Test WorkflowState.set() with list value."""
-    tasks = ["research", "draft", "review"]
-    
-    mock_service_client.set_plan_state = AsyncMock()
-    mock_service_client.get_plan_state = AsyncMock(return_value=WorkingMemoryResponse(
-        id="1",
-        tenant_id="tenant-1",
-        plan_id="plan-123",
-        key="tasks",
-        value=tasks,
-        updated_at="2026-01-22T00:00:00Z",
-    ))
-    
-    memory_client = MemoryClient()
-    memory_client._client = mock_service_client
-    state = WorkflowState(
-        memory_client, 
-        "plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user"
-    )
-    
-    # Test: Set list
-    await state.set("tasks", tasks)
-    
-    # Verify: Raw list passed
-    mock_service_client.set_plan_state.assert_called_once_with(
-        "plan-123",
-        "tasks",
-        tasks,
-        service_tenant_id="test-tenant",
-        service_user_id="test-user",
-    )
-    
-    # Test: Get list
-    result = await state.get("tasks")
-    assert result == tasks
+    Call history, return values and side effects are cleared before each test.
+    """
+    client, _, _ = _service_stack
+    client.reset_mock(return_value=True, side_effect=True)
+    return _service_stack
 
 
 @pytest.mark.asyncio
-async def test_workflow_state_with_dict_value(mock_service_client):
-    """Test WorkflowState.set() with dict value."""
-    research_data = {"findings": ["fact1", "fact2"], "source": "web"}
+@pytest.mark.parametrize(
+    "key,value",
+    [
+        ("goal", "buy 100 bitcoins"),
+        ("current_task_index", 0),
+        ("tasks", ["research", "draft", "review"]),
+        ("research", {"findings": ["fact1", "fact2"], "source": "web"}),
+    ],
+    ids=["string", "integer", "list", "dict"],
+)
+async def test_workflow_state_set_get(service_stack, key, value):
+    """Test WorkflowState.set()/get() round-trip raw values of each type."""
+    mock_service_client, _memory_client, state = service_stack
     
-    mock_service_client.set_plan_state = AsyncMock()
-    mock_service_client.get_plan_state = AsyncMock(return_value=WorkingMemoryResponse(
-        id="1",
-        tenant_id="tenant-1",
-        plan_id="plan-123",
-        key="research",
-        value=research_data,
-        updated_at="2026-01-22T00:00:00Z",
-    ))
-    
-    memory_client = MemoryClient()
-    memory_client._client = mock_service_client
-    state = WorkflowState(
-        memory_client, 
-        "plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user"
+    # Setup mock
+    mock_service_client.get_plan_state.return_value = _WMR_TEMPLATE.model_copy(
+        update={"key": key, "value": value}  # Value stored directly
     )
     
-    # Test: Set dict
-    await state.set("research", research_data)
+    # Test: Set value
+    await state.set(key, value)
     
-    # Verify: Raw dict passed
+    # Verify: Raw value passed to set_plan_state (which wraps it internally)
     mock_service_client.set_plan_state.assert_called_once_with(
         "plan-123",
-        "research",
-        research_data,
+        key,
+        value,  # Raw value, no wrapping in store()
         service_tenant_id="test-tenant",
         service_user_id="test-user",
     )
     
-    # Test: Get dict
-    result = await state.get("research")
-    assert result == research_data
+    # Test: Get value
+    result = await state.get(key)
+    
+    # Verify: Value returned directly
+    assert result == value
 
 
 @pytest.mark.asyncio
-async def test_workflow_state_record_action(mock_service_client):
+async def test_workflow_state_record_action(service_stack):
     """Test WorkflowState.record_action() wraps action history."""
-    mock_service_client.retrieve = AsyncMock(return_value=None)  # No history yet
-    mock_service_client.store = AsyncMock()
-    mock_service_client.set_plan_state = AsyncMock()
-    mock_service_client.get_plan_state = AsyncMock(
-        side_effect=[
-            # First call: no history
-            Exception("404"),
-            # Second call: history exists
-            WorkingMemoryResponse(
-                id="1",
-                tenant_id="tenant-1",
-                plan_id="plan-123",
-                key="_action_history",
-                value={"value": {"actions": ["research.started"]}},
-                updated_at="2026-01-22T00:00:00Z",
-            )
-        ]
-    )
-    
-    memory_client = MemoryClient()
-    memory_client._client = mock_service_client
-    state = WorkflowState(
-        memory_client, 
-        "plan-123",
-        tenant_id="test-tenant",
-        user_id="test-user"
-    )
+    mock_service_client, _memory_client, state = service_stack
+    mock_service_client.retrieve.return_value = None  # No history yet
+    mock_service_client.get_plan_state.side_effect = [
+        # First call: no history
+        Exception("404"),
+        # Second call: history exists
+        _WMR_TEMPLATE.model_copy(update={
+            "key": "_action_history",
+            "value": {"value": {"actions": ["research.started"]}},
+        })
+    ]
     
     # Test: Record first action
     await state.record_action("research.started")
@@ -233,12 +126,9 @@ async def test_workflow_state_record_action(mock_service_client):
 
 
 @pytest.mark.asyncio
-async def test_context_memory_client_store_raw_values(mock_service_client):
+async def test_context_memory_client_store_raw_values(service_stack):
     """Test context.MemoryClient.store() wraps raw values correctly."""
-    mock_service_client.set_plan_state = AsyncMock()
-    
-    memory_client = MemoryClient()
-    memory_client._client = mock_service_client
+    mock_service_client, memory_client, _state = service_stack
     
     # Test various raw value types - no wrapping in store()
     test_cases = [
@@ -272,10 +162,9 @@ async def test_context_memory_client_store_raw_values(mock_service_client):
 
 
 @pytest.mark.asyncio
-async def test_context_memory_client_retrieve_unwraps_values(mock_service_client):
+async def test_context_memory_client_retrieve_unwraps_values(service_stack):
     """Test context.MemoryClient.retrieve() unwraps values correctly."""
-    memory_client = MemoryClient()
-    memory_client._client = mock_service_client
+    mock_service_client, memory_client, _state = service_stack
     
     # Test various value types - returned directly
     test_cases = [
@@ -288,14 +177,9 @@ async def test_context_memory_client_retrieve_unwraps_values(mock_service_client
     ]
     
     for key, stored_value in test_cases:
-        mock_service_client.get_plan_state = AsyncMock(return_value=WorkingMemoryResponse(
-            id="1",
-            tenant_id="tenant-1",
-            plan_id="plan-123",
-            key=key,
-            value=stored_value,
-            updated_at="2026-01-22T00:00:00Z",
-        ))
+        mock_service_client.get_plan_state.return_value = _WMR_TEMPLATE.model_copy(
+            update={"key": key, "value": stored_value}
+        )
         
         result = await memory_client.retrieve(
             key, 
@@ -5,10 +5,39 @@ All adapters must implement this interface to ensure consistent behavior
 across different message bus implementations (NATS, Kafka, Google Pub/Sub, etc.).
 """
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+import orjson
 
 # Type alias for message handlers
 MessageHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+# Handlers subscribed with deliver_raw receive the UTF-8 JSON payload instead
+RawMessageHandler = Callable[[str, bytes], Awaitable[None]]
+# Content filter applied to the decoded message before delivery
+MessagePredicate = Callable[[Dict[str, Any]], bool]
+
+
+class EncodedMessage(dict):
+    """
+    Message payload that remembers its JSON encoding.
+    
+    Adapters deliver this dict subclass to handlers so the wire form is
+    produced at most once per message, however many subscribers forward it
+    (e.g. as SSE data). Handlers must not mutate a message after calling
+    ``to_json()``; the cached bytes would no longer match.
+    """
+    
+    __slots__ = ("_raw",)
+    
+    def __init__(self, payload: Dict[str, Any], raw: bytes | None = None):
+        super().__init__(payload)
+        self._raw = raw
+    
+    def to_json(self) -> bytes:
+        """Return the UTF-8 JSON encoding of this message, encoding it on first use."""
+        if self._raw is None:
+            self._raw = orjson.dumps(self)
+        return self._raw
 
 
 class EventAdapter(ABC):
@@ -61,6 +90,43 @@ class EventAdapter(ABC):
         """
         pass
     
+    async def publish_bytes(self, topic: str, payload: bytes) -> None:
+        """
+        Publish a message that is already JSON encoded.
+        
+        Callers that hold the wire form (e.g. a serialized pydantic model)
+        use this to avoid a decode/encode round-trip. Adapters that can put
+        bytes on the bus directly should override it; the default decodes
+        the payload and delegates to publish().
+        
+        Args:
+            topic: The topic/subject to publish to (e.g., "action-requests")
+            payload: UTF-8 JSON encoding of the message
+        
+        Raises:
+            PublishError: If the message could not be published
+            ConnectionError: If not connected to the message bus
+        """
+        await self.publish(topic, EncodedMessage(orjson.loads(payload), raw=payload))
+    
+    async def publish_batch(self, items: List[Tuple[str, bytes]]) -> None:
+        """
+        Publish several already JSON-encoded messages.
+        
+        Adapters that can amortize writes across messages (one flush per
+        batch rather than one per message) should override this; the
+        default publishes each item in order via publish_bytes().
+        
+        Args:
+            items: (topic, payload) pairs, payloads as UTF-8 JSON
+        
+        Raises:
+            PublishError: If a message could not be published
+            ConnectionError: If not connected to the message bus
+        """
+        for topic, payload in items:
+            await self.publish_bytes(topic, payload)
+    
     @abstractmethod
     async def subscribe(
         self,
@@ -68,6 +134,8 @@ class EventAdapter(ABC):
         handler: MessageHandler,
         subscription_id: str | None = None,
         queue_group: str | None = None,
+        deliver_raw: bool = False,
+        predicate: MessagePredicate | None = None,
     ) -> str:
         """
         Subscribe to one or more topics.
@@ -80,6 +148,10 @@ class EventAdapter(ABC):
             queue_group: Optional queue group name for load balancing.
                          If provided, messages will be distributed among subscribers
                          in the same group.
+            deliver_raw: If True, the handler receives the encoded JSON bytes
+                         (a RawMessageHandler) and the adapter skips decoding
+            predicate: Optional filter on the decoded message; messages it
+                       rejects are not delivered to this subscription
         
         Returns:
             Subscription ID that can be used to unsubscribe
@@ -9,15 +9,62 @@ This adapter is primarily used for:
 Messages are stored in memory and delivered to subscribers synchronously.
 """
 import asyncio
-import fnmatch
+import itertools
 import logging
-from typing import Any, Dict, List, Set
-from uuid import uuid4
+from collections import OrderedDict, deque
+from typing import Any, Coroutine, Deque, Dict, FrozenSet, List, Tuple
 
-from .base import EventAdapter, MessageHandler, PublishError
+import orjson
+
+from .base import (
+    EncodedMessage,
+    EventAdapter,
+    MessageHandler,
+    MessagePredicate,
+    PublishError,
+    RawMessageHandler,
+)
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of topics whose matching subscriptions are memoized
+MATCH_CACHE_SIZE = 1024
+
+
+def _raw_delivery(handler: RawMessageHandler) -> MessageHandler:
+    """Adapt a raw handler to receive each message's cached JSON encoding."""
+    async def deliver(topic: str, message: EncodedMessage) -> None:
+        await handler(topic, message.to_json())
+    return deliver
+
+
+class _Sub:
+    """Compact subscription record."""
+    
+    __slots__ = ("patterns", "pattern_parts", "handler", "queue_group", "predicate")
+    
+    def __init__(
+        self,
+        patterns: List[str],
+        pattern_parts: List[Tuple[str, ...]],
+        handler: MessageHandler,
+        queue_group: str | None,
+        predicate: MessagePredicate | None = None,
+    ):
+        self.patterns = patterns
+        self.pattern_parts = pattern_parts
+        self.handler = handler
+        self.queue_group = queue_group
+        self.predicate = predicate
+    
+    def accepts(self, message: Dict[str, Any]) -> bool:
+        """Apply the subscription's predicate; a failing predicate rejects."""
+        try:
+            return bool(self.predicate(message))
+        except Exception as e:
+            logger.error("Subscription predicate failed: %s", e)
+            return False
+
 
 class MemoryAdapter(EventAdapter):
     """
@@ -28,6 +75,10 @@ class MemoryAdapter(EventAdapter):
     
     Features:
     - Wildcard pattern matching (e.g., "research.*", "events.*")
+    - Indexed dispatch: literal topics are looked up in a dict and wildcard
+      patterns in a token trie, memoized per topic, so a publish costs the
+      number of matching subscriptions rather than all of them
+    - Queue groups: one member per group per message, round-robin
     - Synchronous delivery (messages delivered immediately)
     - No persistence (messages not stored)
     """
@@ -35,13 +86,33 @@ class MemoryAdapter(EventAdapter):
     def __init__(self):
         """Initialize the memory adapter."""
         self._connected = False
-        self._subscriptions: Dict[str, Dict[str, Any]] = {}
-        # Pattern -> Set of subscription IDs
-        self._pattern_subs: Dict[str, Set[str]] = {}
-        # Queue group -> List of subscription IDs (for round-robin)
-        self._queue_groups: Dict[str, List[str]] = {}
-        # Queue group -> Current index (for round-robin)
-        self._queue_group_cursors: Dict[str, int] = {}
+        self._subscriptions: Dict[str, _Sub] = {}
+        # Default subscription IDs only need to be unique within this process
+        self._sub_counter = itertools.count()
+        # Literal topic -> Subscription IDs (patterns without wildcards)
+        # Lists, not sets: iterated on every cache miss, mutated rarely
+        self._exact_subs: Dict[str, List[str]] = {}
+        # Token trie of wildcard patterns (see _new_trie_node)
+        self._trie: Dict[str, Any] = self._new_trie_node()
+        # Bumped on every subscription change; invalidates the match cache
+        self._sub_epoch = 0
+        # (epoch, topic) -> Matching subscription IDs, oldest first
+        self._match_cache: "OrderedDict[Tuple[int, str], FrozenSet[str]]" = OrderedDict()
+        # Queue group -> Ring of subscription IDs, next in line first
+        self._queue_groups: Dict[str, Deque[str]] = {}
+        # Number of live subscriptions that belong to a queue group; while
+        # zero, every match is a broadcast and grouping is skipped
+        self._has_queue_groups = 0
+        # Publishes awaiting the next flush: (topic, message, delivered future)
+        self._publish_queue: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        # Pending flush of _publish_queue, if one is scheduled
+        self._flush_task: asyncio.Task | None = None
+        # Deliveries currently awaiting handlers; while non-zero, new
+        # publishes are queued instead of delivered inline
+        self._delivering = 0
+        # Scratch buffers for _select_deliveries
+        self._scratch_selected: List[Tuple[str, MessageHandler]] = []
+        self._scratch_groups: Dict[str, Dict[str, MessageHandler]] = {}
     
     async def connect(self) -> None:
         """Mark adapter as connected."""
@@ -55,7 +126,13 @@ class MemoryAdapter(EventAdapter):
     async def disconnect(self) -> None:
         """Disconnect and clean up subscriptions."""
         self._subscriptions.clear()
-        self._pattern_subs.clear()
+        self._exact_subs.clear()
+        self._trie = self._new_trie_node()
+        self._queue_groups.clear()
+        self._has_queue_groups = 0
+        self._scratch_groups.clear()
+        self._sub_epoch += 1
+        self._match_cache.clear()
         self._connected = False
         logger.info("Memory adapter disconnected")
     
@@ -63,7 +140,10 @@ class MemoryAdapter(EventAdapter):
         """
         Publish a message to matching subscribers.
         
-        Messages are delivered synchronously to all matching handlers.
+        Messages are delivered synchronously to all matching handlers:
+        the call returns once delivery has finished. When no other delivery
+        is in flight the handlers are run inline; publishes that arrive while
+        one is in flight are queued and delivered together in one batch.
         
         Args:
             topic: The topic to publish to
@@ -72,73 +152,246 @@ class MemoryAdapter(EventAdapter):
         if not self._connected:
             raise ConnectionError("Memory adapter not connected")
         
-        logger.debug(f"Publishing to topic: {topic}")
+        logger.debug("Publishing to topic: %s", topic)
+        
+        # Shared by every matching handler, so it is encoded at most once
+        if not isinstance(message, EncodedMessage):
+            message = EncodedMessage(message)
+        
+        if self._delivering or self._flush_task is not None:
+            await self._enqueue([(topic, message)])
+            return
+        
+        deliveries = self._build_deliveries(topic, message)
+        if not deliveries:
+            return
+        self._delivering += 1
+        try:
+            await self._deliver(deliveries)
+        finally:
+            self._delivering -= 1
+    
+    async def publish_batch(self, items: List[Tuple[str, bytes]]) -> None:
+        """
+        Publish several pre-encoded messages as one delivery batch.
+        
+        The call returns once every matching handler has run.
+        
+        Args:
+            items: (topic, payload) pairs, payloads as UTF-8 JSON
+        """
+        if not self._connected:
+            raise ConnectionError("Memory adapter not connected")
+        if not items:
+            return
+        
+        messages = [
+            (topic, EncodedMessage(orjson.loads(payload), raw=payload))
+            for topic, payload in items
+        ]
+        
+        if self._delivering or self._flush_task is not None:
+            await self._enqueue(messages)
+            return
+        
+        deliveries = []
+        try:
+            for topic, message in messages:
+                deliveries.extend(self._build_deliveries(topic, message))
+        except BaseException:
+            self._close_deliveries(deliveries)
+            raise
+        if not deliveries:
+            return
+        self._delivering += 1
+        try:
+            await self._deliver(deliveries)
+        finally:
+            self._delivering -= 1
+    
+    async def _enqueue(self, messages: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Queue messages for the next flush and wait until they are delivered."""
+        loop = asyncio.get_running_loop()
+        # One future per call; the flush resolves it once
+        delivered = loop.create_future()
+        for topic, message in messages:
+            self._publish_queue.append((topic, message, delivered))
+        
+        # First queued publish schedules the flush; later ones join it
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_publish_queue())
+        
+        await delivered
+    
+    async def _flush_publish_queue(self) -> None:
+        """Deliver every queued publish in one consolidated pass."""
+        batch, self._publish_queue = self._publish_queue, []
+        # Publishes made by handlers during delivery are not blocked on this flush
+        self._flush_task = None
+        
+        try:
+            # (topic, handler coroutine) for every delivery in the batch
+            deliveries = []
+            for topic, message, delivered in batch:
+                if delivered.done():
+                    continue
+                try:
+                    deliveries.extend(self._build_deliveries(topic, message))
+                except Exception as e:
+                    # Only the publisher of this message sees the failure
+                    delivered.set_exception(e)
+            
+            self._delivering += 1
+            try:
+                await self._deliver(deliveries)
+            finally:
+                self._delivering -= 1
+        except BaseException as e:
+            for _, _, delivered in batch:
+                if not delivered.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        delivered.cancel()
+                    else:
+                        delivered.set_exception(e)
+            raise
+        else:
+            for _, _, delivered in batch:
+                if not delivered.done():
+                    delivered.set_result(None)
+    
+    def _build_deliveries(
+        self, topic: str, message: Dict[str, Any]
+    ) -> List[Tuple[str, Coroutine[Any, Any, None]]]:
+        """
+        Create the handler coroutines that deliver a message.
+        
+        If selection or a handler call raises, coroutines already created
+        are closed before the error propagates, so none is left unawaited.
+        
+        Args:
+            topic: The topic being published to
+            message: The message payload
+        
+        Returns:
+            List of (topic, handler coroutine) pairs
+        """
+        deliveries = []
+        try:
+            for _, handler in self._select_deliveries(topic, message):
+                deliveries.append((topic, handler(topic, message)))
+        except BaseException:
+            self._close_deliveries(deliveries)
+            raise
+        return deliveries
+    
+    @staticmethod
+    def _close_deliveries(
+        deliveries: List[Tuple[str, Coroutine[Any, Any, None]]]
+    ) -> None:
+        """Close handler coroutines that will never be awaited."""
+        for _, delivery in deliveries:
+            delivery.close()
+    
+    async def _deliver(
+        self, deliveries: List[Tuple[str, Coroutine[Any, Any, None]]]
+    ) -> None:
+        """Await handler coroutines, logging rather than raising their errors."""
+        # Single delivery: await the handler directly, no gather/Task overhead
+        if len(deliveries) == 1:
+            topic, delivery = deliveries[0]
+            try:
+                await delivery
+            except Exception as e:
+                logger.error("Handler error for topic %s: %s", topic, e)
+            return
+        
+        # return_exceptions isolates handler failures from each other
+        results = await asyncio.gather(
+            *(delivery for _, delivery in deliveries),
+            return_exceptions=True,
+        )
+        for (topic, _), result in zip(deliveries, results):
+            if isinstance(result, Exception):
+                logger.error("Handler error for topic %s: %s", topic, result)
+    
+    def _select_deliveries(
+        self, topic: str, message: Dict[str, Any]
+    ) -> List[Tuple[str, MessageHandler]]:
+        """
+        Choose the subscribers that receive a message on a topic.
         
+        Every matching broadcast subscriber is selected, plus one member
+        per matching queue group (round-robin). Subscriptions whose
+        predicate rejects the message are skipped before either step.
+        
+        Args:
+            topic: The topic being published to
+            message: The message being published
+        
+        Returns:
+            List of (subscription ID, handler) pairs. This is a reused
+            scratch buffer, valid only until the next call.
+        """
         # Find all matching subscriptions
         matching_subs = self._find_matching_subscriptions(topic)
         
         if not matching_subs:
-            logger.debug(f"No subscribers for topic: {topic}")
-            return
-        
-        # Group subscriptions by queue group
-        # None key is for subscribers without a queue group (broadcast)
-        grouped_subs: Dict[str | None, List[str]] = {None: []}
+            logger.debug("No subscribers for topic: %s", topic)
+            return []
+        
+        # No queue groups anywhere: every match is a broadcast subscriber
+        if not self._has_queue_groups:
+            final_subs = self._scratch_selected
+            final_subs.clear()
+            subscriptions = self._subscriptions
+            for sub_id in matching_subs:
+                sub = subscriptions.get(sub_id)
+                if sub is not None and (sub.predicate is None or sub.accepts(message)):
+                    final_subs.append((sub_id, sub.handler))
+            return final_subs
+        
+        # Split matches into broadcast subscribers and queue-group members
+        # Entries carry the handler so delivery needs no second lookup
+        # Both are scratch buffers reused across calls; selection never awaits,
+        # so no other publish can observe them mid-use
+        final_subs = self._scratch_selected
+        final_subs.clear()
+        grouped_subs = self._scratch_groups
+        for members in grouped_subs.values():
+            members.clear()
         
         for sub_id in matching_subs:
-            if sub_id in self._subscriptions:
-                q_group = self._subscriptions[sub_id].get("queue_group")
-                if q_group:
-                    if q_group not in grouped_subs:
-                        grouped_subs[q_group] = []
-                    grouped_subs[q_group].append(sub_id)
-                else:
-                    grouped_subs[None].append(sub_id)
-        
-        # Determine final list of subscribers to deliver to
-        final_subs = []
-        
-        # 1. Broadcast to all non-queue-group subscribers
-        final_subs.extend(grouped_subs[None])
-        
-        # 2. Round-robin for each queue group
-        for q_group, sub_ids in grouped_subs.items():
-            if q_group is None:
+            sub = self._subscriptions.get(sub_id)
+            if sub is None:
                 continue
-                
-            # Sort sub_ids to ensure deterministic order for round-robin
-            # (though in memory adapter, order in list is usually insertion order)
-            # We need to pick ONE from this list based on global cursor for this group
-            
-            # Note: The simple cursor approach in __init__ is global per group, 
-            # but here we have a subset of subs that match the topic.
-            # To keep it simple and effective for testing:
-            # We'll use the global cursor to pick the next sub_id from the *available matching* subs.
-            
-            if not sub_ids:
+            if sub.predicate is not None and not sub.accepts(message):
                 continue
-                
-            cursor = self._queue_group_cursors.get(q_group, 0)
-            selected_index = cursor % len(sub_ids)
-            selected_sub = sub_ids[selected_index]
-            final_subs.append(selected_sub)
-            
-            # Advance cursor
-            self._queue_group_cursors[q_group] = cursor + 1
-        
-        # Deliver to selected handlers
-        delivery_tasks = []
-        for sub_id in final_subs:
-            if sub_id in self._subscriptions:
-                handler = self._subscriptions[sub_id]["handler"]
-                delivery_tasks.append(self._deliver_message(handler, topic, message))
-        
-        # Wait for all deliveries to complete
-        if delivery_tasks:
-            results = await asyncio.gather(*delivery_tasks, return_exceptions=True)
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error delivering message: {result}")
+            q_group = sub.queue_group
+            if q_group:
+                if q_group not in grouped_subs:
+                    grouped_subs[q_group] = {}
+                grouped_subs[q_group][sub_id] = sub.handler
+            else:
+                # Broadcast to all non-queue-group subscribers
+                final_subs.append((sub_id, sub.handler))
+        
+        # Round-robin for each queue group: deliver to the first member of
+        # the group's ring that matches this topic, then move only that member
+        # to the back; skipped members keep their place in line
+        for q_group, members in grouped_subs.items():
+            if not members:
+                continue
+            ring = self._queue_groups[q_group]
+            for index, sub_id in enumerate(ring):
+                if sub_id in members:
+                    break
+            else:
+                continue
+            del ring[index]
+            ring.append(sub_id)
+            final_subs.append((sub_id, members[sub_id]))
+        
+        return final_subs
     
     async def subscribe(
         self,
@@ -146,6 +399,8 @@ class MemoryAdapter(EventAdapter):
         handler: MessageHandler,
         subscription_id: str | None = None,
         queue_group: str | None = None,
+        deliver_raw: bool = False,
+        predicate: MessagePredicate | None = None,
     ) -> str:
         """
         Subscribe to topics with pattern matching support.
@@ -158,7 +413,12 @@ class MemoryAdapter(EventAdapter):
             topics: List of topic patterns
             handler: Async callback function
             subscription_id: Optional subscription identifier
-            queue_group: Optional queue group (ignored in memory adapter)
+            queue_group: Optional queue group (one member per group receives
+                each message, round-robin)
+            deliver_raw: Pass the handler the message's JSON bytes instead
+            predicate: Only deliver messages for which this returns True
+                (a rejected message does not use up this member's turn in
+                its queue group)
         
         Returns:
             Subscription ID
@@ -170,26 +430,33 @@ class MemoryAdapter(EventAdapter):
             # logger.warning("Queue groups are not fully supported in MemoryAdapter (broadcast only)")
             pass
 
-        sub_id = subscription_id or str(uuid4())
+        sub_id = subscription_id or f"mem-{next(self._sub_counter)}"
+        if deliver_raw:
+            handler = _raw_delivery(handler)
+        
+        # Split once here; the trie is maintained from the stored parts
+        pattern_parts = [tuple(pattern.split(".")) for pattern in topics]
         
-        self._subscriptions[sub_id] = {
-            "patterns": topics,
-            "handler": handler,
-            "queue_group": queue_group,
-        }
+        self._subscriptions[sub_id] = _Sub(
+            topics, pattern_parts, handler, queue_group, predicate
+        )
         
         # Index patterns for efficient matching
-        for pattern in topics:
-            if pattern not in self._pattern_subs:
-                self._pattern_subs[pattern] = set()
-            self._pattern_subs[pattern].add(sub_id)
+        for pattern, parts in zip(topics, pattern_parts):
+            if "*" in pattern or ">" in pattern:
+                self._trie_insert(parts, sub_id)
+            else:
+                if pattern not in self._exact_subs:
+                    self._exact_subs[pattern] = []
+                self._exact_subs[pattern].append(sub_id)
+        self._sub_epoch += 1
         
         # Add to queue group if specified
         if queue_group:
             if queue_group not in self._queue_groups:
-                self._queue_groups[queue_group] = []
-                self._queue_group_cursors[queue_group] = 0
+                self._queue_groups[queue_group] = deque()
             self._queue_groups[queue_group].append(sub_id)
+            self._has_queue_groups += 1
         
         logger.info(f"Subscribed to {topics} (sub_id: {sub_id})")
         return sub_id
@@ -203,20 +470,23 @@ class MemoryAdapter(EventAdapter):
         sub_data = self._subscriptions.pop(subscription_id)
         
         # Remove from pattern index
-        for pattern in sub_data["patterns"]:
-            if pattern in self._pattern_subs:
-                self._pattern_subs[pattern].discard(subscription_id)
-                if not self._pattern_subs[pattern]:
-                    del self._pattern_subs[pattern]
+        for pattern, parts in zip(sub_data.patterns, sub_data.pattern_parts):
+            if "*" in pattern or ">" in pattern:
+                self._trie_remove(parts, subscription_id)
+            elif subscription_id in self._exact_subs.get(pattern, ()):
+                self._exact_subs[pattern].remove(subscription_id)
+                if not self._exact_subs[pattern]:
+                    del self._exact_subs[pattern]
+        self._sub_epoch += 1
         
         # Remove from queue group
-        queue_group = sub_data.get("queue_group")
+        queue_group = sub_data.queue_group
         if queue_group and queue_group in self._queue_groups:
             if subscription_id in self._queue_groups[queue_group]:
                 self._queue_groups[queue_group].remove(subscription_id)
+                self._has_queue_groups -= 1
                 if not self._queue_groups[queue_group]:
                     del self._queue_groups[queue_group]
-                    del self._queue_group_cursors[queue_group]
         
         logger.info(f"Unsubscribed: {subscription_id}")
     
@@ -225,78 +495,159 @@ class MemoryAdapter(EventAdapter):
         """Check if adapter is connected."""
         return self._connected
     
-    def _find_matching_subscriptions(self, topic: str) -> Set[str]:
+    def _find_matching_subscriptions(self, topic: str) -> FrozenSet[str]:
         """
         Find all subscriptions that match a topic.
         
-        Supports NATS-style wildcards:
-        - "*" matches exactly one token
-        - ">" matches one or more tokens (only at end)
+        Results are memoized per topic until the next subscription change.
         
         Args:
             topic: The topic to match against
         
         Returns:
-            Set of matching subscription IDs
+            Frozen set of matching subscription IDs
         """
-        matching = set()
-        
-        for pattern, sub_ids in self._pattern_subs.items():
-            if self._pattern_matches(pattern, topic):
-                matching.update(sub_ids)
-        
+        key = (self._sub_epoch, topic)
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            self._match_cache.move_to_end(key)
+            return cached
+        
+        # Entries from an older epoch can never be hit again
+        if self._match_cache and next(iter(self._match_cache))[0] != self._sub_epoch:
+            self._match_cache.clear()
+        
+        exact = self._exact_subs.get(topic, ())
+        root = self._trie
+        if root["children"] or root["*"] is not None or root[">"]:
+            candidates = self._match_trie(topic)
+            candidates.extend(exact)
+            # frozenset also drops IDs reached through several patterns
+            matching = frozenset(candidates)
+        else:
+            # No wildcard subscriptions: literal lookup is the whole answer
+            matching = frozenset(exact)
+        self._match_cache[key] = matching
+        if len(self._match_cache) > MATCH_CACHE_SIZE:
+            self._match_cache.popitem(last=False)
         return matching
     
-    def _pattern_matches(self, pattern: str, topic: str) -> bool:
+    def _match_trie(self, topic: str) -> List[str]:
         """
-        Check if a pattern matches a topic.
+        Walk the wildcard pattern trie for a topic.
+        
+        Supports NATS-style wildcards:
+        - "*" matches exactly one token
+        - ">" matches one or more tokens (only at end)
         
         Args:
-            pattern: Pattern with optional wildcards
-            topic: Topic to match
+            topic: The topic to match against
         
         Returns:
-            True if pattern matches topic
+            List of matching subscription IDs (may contain duplicates)
         """
-        # Exact match
-        if pattern == topic:
-            return True
-        
-        # Handle NATS-style wildcards
-        pattern_parts = pattern.split(".")
-        topic_parts = topic.split(".")
-        
-        # ">" matches any remaining segments
-        if pattern_parts[-1] == ">":
-            # Pattern without ">" must match the beginning
-            prefix_pattern = pattern_parts[:-1]
-            if len(topic_parts) < len(prefix_pattern):
-                return False
-            for i, p in enumerate(prefix_pattern):
-                if p != "*" and p != topic_parts[i]:
-                    return False
-            return True
-        
-        # Must have same number of parts for "*" matching
-        if len(pattern_parts) != len(topic_parts):
-            return False
+        matching: List[str] = []
+        root = self._trie
+        
+        # Root children bucket wildcard patterns by their first token; when
+        # neither that bucket nor a leading "*"/">" pattern exists, nothing
+        # can match and the topic need not be split at all
+        if (
+            root["*"] is None
+            and not root[">"]
+            and topic.partition(".")[0] not in root["children"]
+        ):
+            return matching
+        
+        nodes = [root]
+        
+        # Walk literal and "*" branches in lockstep; any ">" seen on the way
+        # matches the remaining tokens
+        for token in topic.split("."):
+            next_nodes = []
+            for node in nodes:
+                matching.extend(node[">"])
+                child = node["children"].get(token)
+                if child is not None:
+                    next_nodes.append(child)
+                if node["*"] is not None:
+                    next_nodes.append(node["*"])
+            nodes = next_nodes
+            if not nodes:
+                return matching
+        
+        # Topic fully consumed: exact/"*" patterns end here, and a trailing
+        # ">" also matches its bare prefix
+        for node in nodes:
+            matching.extend(node["leaf"])
+            matching.extend(node[">"])
         
-        # Match each part
-        for p, t in zip(pattern_parts, topic_parts):
-            if p != "*" and p != t:
-                return False
+        return matching
+    
+    @staticmethod
+    def _new_trie_node() -> Dict[str, Any]:
+        """
+        Create an empty pattern trie node.
         
-        return True
+        Keys:
+        - "children": literal token -> child node
+        - "*": child node for the single-token wildcard (or None)
+        - ">": subscription IDs whose pattern ends with ">" at this depth
+        - "leaf": subscription IDs whose pattern ends at this node
+        """
+        return {"children": {}, "*": None, ">": [], "leaf": []}
     
-    async def _deliver_message(
-        self,
-        handler: MessageHandler,
-        topic: str,
-        message: Dict[str, Any],
-    ) -> None:
-        """Deliver a message to a handler."""
-        try:
-            await handler(topic, message)
-        except Exception as e:
-            logger.error(f"Handler error for topic {topic}: {e}")
-            raise
+    def _trie_insert(self, tokens: Tuple[str, ...], sub_id: str) -> None:
+        """Index a pre-split subscription pattern in the trie."""
+        node = self._trie
+        last = len(tokens) - 1
+        
+        for i, token in enumerate(tokens):
+            if token == ">" and i == last:
+                node[">"].append(sub_id)
+                return
+            if token == "*":
+                if node["*"] is None:
+                    node["*"] = self._new_trie_node()
+                node = node["*"]
+            else:
+                children = node["children"]
+                if token not in children:
+                    children[token] = self._new_trie_node()
+                node = children[token]
+        
+        node["leaf"].append(sub_id)
+    
+    def _trie_remove(self, tokens: Tuple[str, ...], sub_id: str) -> None:
+        """Remove a pre-split pattern from the trie, pruning empty nodes."""
+        node = self._trie
+        last = len(tokens) - 1
+        # (parent, key) pairs leading to the current node
+        path = []
+        
+        for i, token in enumerate(tokens):
+            if token == ">" and i == last:
+                if sub_id in node[">"]:
+                    node[">"].remove(sub_id)
+                break
+            if token == "*":
+                child = node["*"]
+            else:
+                child = node["children"].get(token)
+            if child is None:
+                return
+            path.append((node, token))
+            node = child
+        else:
+            if sub_id in node["leaf"]:
+                node["leaf"].remove(sub_id)
+        
+        # Prune nodes that no longer hold subscriptions or children
+        for parent, token in reversed(path):
+            if node["children"] or node["*"] or node[">"] or node["leaf"]:
+                break
+            if token == "*":
+                parent["*"] = None
+            else:
+                del parent["children"][token]
+            node = parent
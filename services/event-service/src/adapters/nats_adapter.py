@@ -5,19 +5,103 @@ This adapter implements the EventAdapter interface using NATS JetStream
 as the underlying message bus.
 """
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List
+import weakref
+from typing import Any, Dict, List, Tuple
 from uuid import uuid4
 
 import nats
+import orjson
 from nats.aio.client import Client as NatsClient
 from nats.aio.msg import Msg
 
-from .base import EventAdapter, MessageHandler, PublishError, SubscriptionError
+from .base import (
+    EncodedMessage,
+    EventAdapter,
+    MessageHandler,
+    MessagePredicate,
+    PublishError,
+    SubscriptionError,
+)
 
 logger = logging.getLogger(__name__)
 
+# Soorma namespace prepended to every topic on the NATS side
+SUBJECT_PREFIX = "soorma.events."
+_SUBJECT_PREFIX_LEN = len(SUBJECT_PREFIX)
+
+# Pool key: (server URL, reconnect_time_wait, max_reconnect_attempts), so
+# adapters only share a connection opened with their own reconnect policy
+_PoolKey = Tuple[str, int, int]
+
+
+class _LoopPool:
+    """NATS connections shared by the adapters running on one event loop."""
+    
+    __slots__ = ("clients", "refs", "lock")
+    
+    def __init__(self) -> None:
+        # Pool key -> Shared client, and the number of connected adapters
+        # using it; the last one to disconnect drains it
+        self.clients: Dict[_PoolKey, NatsClient] = {}
+        self.refs: Dict[_PoolKey, int] = {}
+        self.lock = asyncio.Lock()
+
+
+# nats-py clients are bound to the loop they were created on, so each loop
+# gets its own pool (and lock), created on first use and dropped with the loop
+_LOOP_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_pool() -> _LoopPool:
+    """Return the connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _LOOP_POOLS.get(loop)
+    if pool is None:
+        pool = _LOOP_POOLS[loop] = _LoopPool()
+    return pool
+
+
+def _pattern_covers(pattern: List[str], other: List[str]) -> bool:
+    """Return True if every subject matched by ``other`` is matched by ``pattern``."""
+    for i, token in enumerate(pattern):
+        if token == ">" and i == len(pattern) - 1:
+            # ">" needs at least one more token, which `other` must guarantee
+            return len(other) > i
+        if i >= len(other):
+            return False
+        if token == "*":
+            if other[i] == ">" and i == len(other) - 1:
+                return False
+        elif token != other[i]:
+            return False
+    return len(pattern) == len(other)
+
+
+def collapse_topics(topics: List[str]) -> List[str]:
+    """
+    Reduce topics to the patterns NATS actually needs to subscribe to.
+    
+    Duplicates and topics already covered by another requested wildcard
+    (e.g. "research.completed" under "research.*") are dropped. The set of
+    matched subjects is unchanged, but the server holds fewer subscriptions
+    and no longer delivers a message once per overlapping pattern.
+    """
+    unique = list(dict.fromkeys(topics))
+    split = [topic.split(".") for topic in unique]
+    return [
+        topic
+        for i, topic in enumerate(unique)
+        if not any(
+            j != i and _pattern_covers(split[j], split[i])
+            # Of two equivalent patterns, keep the first
+            and not (j > i and _pattern_covers(split[i], split[j]))
+            for j in range(len(unique))
+        )
+    ]
+
 
 class NatsAdapter(EventAdapter):
     """
@@ -30,6 +114,12 @@ class NatsAdapter(EventAdapter):
     - Automatic reconnection
     - Wildcard subscriptions (e.g., "research.*", "events.>")
     - JSON message serialization
+    
+    Wildcard matching happens on the NATS server: each requested pattern is
+    its own server-side subscription, and inbound messages are routed to the
+    owning callback by subscription ID, so no per-message pattern scan runs
+    in this process. (MemoryAdapter, which matches locally, uses a token
+    trie for the same job.)
     """
     
     def __init__(
@@ -49,53 +139,113 @@ class NatsAdapter(EventAdapter):
         self._url = url
         self._reconnect_time_wait = reconnect_time_wait
         self._max_reconnect_attempts = max_reconnect_attempts
+        self._pool_key: _PoolKey = (url, reconnect_time_wait, max_reconnect_attempts)
         self._client: NatsClient | None = None
         self._subscriptions: Dict[str, nats.aio.subscription.Subscription] = {}
         self._handlers: Dict[str, MessageHandler] = {}
     
     async def connect(self) -> None:
-        """Connect to NATS server with auto-reconnection."""
-        if self._client is not None and self._client.is_connected:
+        """
+        Connect to NATS server with auto-reconnection.
+        
+        Adapters for the same URL and reconnect settings share one pooled
+        connection, so only the first pays the TCP/TLS/auth handshake.
+        Connection lifecycle callbacks are those of the adapter that opened
+        it. Each adapter holds at most one reference to the pooled client.
+        """
+        # A client that is reconnecting is still held; counting it again
+        # would keep the shared connection from ever being drained
+        if self._client is not None and not self._client.is_closed:
             logger.warning("Already connected to NATS")
             return
         
-        logger.info(f"Connecting to NATS at {self._url}")
-        
-        try:
-            self._client = await nats.connect(
-                servers=[self._url],
-                reconnect_time_wait=self._reconnect_time_wait,
-                max_reconnect_attempts=self._max_reconnect_attempts,
-                error_cb=self._error_callback,
-                disconnected_cb=self._disconnected_callback,
-                reconnected_cb=self._reconnected_callback,
-                closed_cb=self._closed_callback,
-            )
-            logger.info(f"Connected to NATS server: {self._client.connected_url}")
-        except Exception as e:
-            logger.error(f"Failed to connect to NATS: {e}")
-            raise ConnectionError(f"Failed to connect to NATS at {self._url}: {e}") from e
+        pool = _loop_pool()
+        async with pool.lock:
+            if self._client is not None:
+                # Closed for good: give up this adapter's reference first
+                self._release_pooled(pool, self._client)
+                self._client = None
+            
+            client = pool.clients.get(self._pool_key)
+            if client is not None and not client.is_closed:
+                logger.info(f"Reusing NATS connection to {self._url}")
+            else:
+                logger.info(f"Connecting to NATS at {self._url}")
+                try:
+                    client = await nats.connect(
+                        servers=[self._url],
+                        reconnect_time_wait=self._reconnect_time_wait,
+                        max_reconnect_attempts=self._max_reconnect_attempts,
+                        error_cb=self._error_callback,
+                        disconnected_cb=self._disconnected_callback,
+                        reconnected_cb=self._reconnected_callback,
+                        closed_cb=self._closed_callback,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to connect to NATS: {e}")
+                    raise ConnectionError(f"Failed to connect to NATS at {self._url}: {e}") from e
+                pool.clients[self._pool_key] = client
+                pool.refs[self._pool_key] = 0
+                logger.info(f"Connected to NATS server: {client.connected_url}")
+            
+            pool.refs[self._pool_key] += 1
+            self._client = client
     
     async def disconnect(self) -> None:
-        """Gracefully disconnect from NATS."""
+        """
+        Gracefully disconnect from NATS.
+        
+        This adapter's subscriptions are always removed; the shared
+        connection is drained only when no other adapter still uses it.
+        """
         if self._client is None:
             return
         
         logger.info("Disconnecting from NATS")
         
         # Unsubscribe from all topics
-        for sub_id in list(self._subscriptions.keys()):
-            await self.unsubscribe(sub_id)
+        subscriptions, self._subscriptions = self._subscriptions, {}
+        for key, sub in subscriptions.items():
+            try:
+                await sub.unsubscribe()
+            except Exception as e:
+                logger.warning(f"Error unsubscribing from {key}: {e}")
+        self._handlers.clear()
+        
+        client, self._client = self._client, None
+        
+        pool = _loop_pool()
+        async with pool.lock:
+            if not self._release_pooled(pool, client):
+                logger.info("NATS connection still in use by other adapters")
+                return
         
         # Drain and close
         try:
-            await self._client.drain()
+            await client.drain()
         except Exception as e:
             logger.warning(f"Error draining NATS connection: {e}")
         
-        self._client = None
         logger.info("Disconnected from NATS")
     
+    def _release_pooled(self, pool: _LoopPool, client: NatsClient) -> bool:
+        """
+        Drop this adapter's reference to a pooled client (pool lock held).
+        
+        Returns:
+            True if no adapter uses the client any more and it should be
+            drained, False while other adapters still hold it
+        """
+        if pool.clients.get(self._pool_key) is not client:
+            # Already replaced in the pool; nobody else shares it
+            return True
+        pool.refs[self._pool_key] -= 1
+        if pool.refs[self._pool_key] > 0:
+            return False
+        del pool.clients[self._pool_key]
+        del pool.refs[self._pool_key]
+        return True
+    
     async def publish(self, topic: str, message: Dict[str, Any]) -> None:
         """
         Publish a message to a NATS subject.
@@ -104,6 +254,20 @@ class NatsAdapter(EventAdapter):
             topic: NATS subject (e.g., "events.action-requests")
             message: Message payload (will be JSON serialized)
         """
+        try:
+            payload = orjson.dumps(message)
+        except TypeError as e:
+            raise PublishError(f"Failed to encode message for {topic}: {e}") from e
+        await self.publish_bytes(topic, payload)
+    
+    async def publish_bytes(self, topic: str, payload: bytes) -> None:
+        """
+        Publish an already JSON-encoded payload to a NATS subject as-is.
+        
+        Args:
+            topic: NATS subject (e.g., "events.action-requests")
+            payload: UTF-8 JSON encoding of the message
+        """
         if not self.is_connected:
             raise ConnectionError("Not connected to NATS")
         
@@ -111,19 +275,43 @@ class NatsAdapter(EventAdapter):
         subject = self._topic_to_subject(topic)
         
         try:
-            payload = json.dumps(message).encode("utf-8")
             await self._client.publish(subject, payload)
-            logger.debug(f"Published message to {subject}")
+            logger.debug("Published message to %s", subject)
         except Exception as e:
-            logger.error(f"Failed to publish to {subject}: {e}")
+            logger.error("Failed to publish to %s: %s", subject, e)
             raise PublishError(f"Failed to publish to {subject}: {e}") from e
     
+    async def publish_batch(self, items: List[Tuple[str, bytes]]) -> None:
+        """
+        Publish several pre-encoded payloads, then flush once.
+        
+        Each publish only appends to the client's pending buffer; the single
+        flush at the end writes the batch and waits for the server to
+        acknowledge it, instead of a round-trip per message.
+        
+        Args:
+            items: (topic, payload) pairs, payloads as UTF-8 JSON
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to NATS")
+        
+        try:
+            for topic, payload in items:
+                await self._client.publish(self._topic_to_subject(topic), payload)
+            await self._client.flush()
+            logger.debug("Published batch of %d messages", len(items))
+        except Exception as e:
+            logger.error("Failed to publish batch: %s", e)
+            raise PublishError(f"Failed to publish batch: {e}") from e
+    
     async def subscribe(
         self,
         topics: List[str],
         handler: MessageHandler,
         subscription_id: str | None = None,
         queue_group: str | None = None,
+        deliver_raw: bool = False,
+        predicate: MessagePredicate | None = None,
     ) -> str:
         """
         Subscribe to one or more NATS subjects.
@@ -133,6 +321,11 @@ class NatsAdapter(EventAdapter):
             handler: Async callback (topic, message) -> None
             subscription_id: Optional subscription identifier
             queue_group: Optional queue group for load balancing
+            deliver_raw: Pass msg.data to the handler without decoding it
+            predicate: Only deliver messages for which this returns True
+                (evaluated on the decoded message, so raw subscriptions with
+                a predicate still decode). In a queue group NATS picks the
+                member first, so a message it rejects is not redelivered.
         
         Returns:
             Subscription ID
@@ -145,24 +338,49 @@ class NatsAdapter(EventAdapter):
         # Create message handler wrapper
         async def nats_handler(msg: Msg) -> None:
             try:
-                topic = self._subject_to_topic(msg.subject)
-                message = json.loads(msg.data.decode("utf-8"))
-                await handler(topic, message)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode message from {msg.subject}: {e}")
-            except Exception as e:
-                logger.error(f"Error in message handler for {msg.subject}: {e}")
+                # Keep the wire bytes so SSE streams can forward them as-is
+                message = EncodedMessage(orjson.loads(msg.data), raw=msg.data)
+            except (orjson.JSONDecodeError, TypeError, ValueError) as e:
+                # A bad payload needs no traceback; formatting stays lazy
+                logger.error("Failed to decode message from %s: %s", msg.subject, e)
+                return
+            if predicate is not None:
+                try:
+                    if not predicate(message):
+                        return
+                except Exception as e:
+                    logger.error("Subscription predicate failed for %s: %s", msg.subject, e)
+                    return
+            try:
+                await handler(
+                    self._subject_to_topic(msg.subject),
+                    msg.data if deliver_raw else message,
+                )
+            except Exception:
+                logger.exception("Error in message handler for %s", msg.subject)
+        
+        # Unfiltered raw subscribers forward the wire bytes, so nothing is decoded
+        async def nats_raw_handler(msg: Msg) -> None:
+            try:
+                await handler(self._subject_to_topic(msg.subject), msg.data)
+            except Exception:
+                logger.exception("Error in message handler for %s", msg.subject)
+        
+        callback = nats_raw_handler if deliver_raw and predicate is None else nats_handler
         
-        # Subscribe to each topic
-        for topic in topics:
+        # Subscribe to each topic not already covered by another one
+        for topic in collapse_topics(topics):
             subject = self._topic_to_subject(topic)
             try:
                 # Pass queue_group to NATS subscribe if provided
                 # If queue_group is set, NATS will load balance messages across
                 # all subscribers with the same queue group name.
+                # With cb=, nats-py drains each subscription in one long-lived
+                # task that awaits the callback per message. Its async-iterator
+                # API (sub.messages) creates a Task per message instead.
                 sub = await self._client.subscribe(
                     subject, 
-                    cb=nats_handler, 
+                    cb=callback, 
                     queue=queue_group or ""
                 )
                 self._subscriptions[f"{sub_id}:{subject}"] = sub
@@ -215,7 +433,7 @@ class NatsAdapter(EventAdapter):
             ">" -> "soorma.events.>"
         """
         # Add Soorma namespace prefix
-        return f"soorma.events.{topic}"
+        return SUBJECT_PREFIX + topic
     
     def _subject_to_topic(self, subject: str) -> str:
         """
@@ -224,9 +442,8 @@ class NatsAdapter(EventAdapter):
         Examples:
             "soorma.events.action-requests" -> "action-requests"
         """
-        prefix = "soorma.events."
-        if subject.startswith(prefix):
-            return subject[len(prefix):]
+        if subject.startswith(SUBJECT_PREFIX):
+            return subject[_SUBJECT_PREFIX_LEN:]
         return subject
     
     async def _cleanup_partial_subscription(self, sub_id: str) -> None:
@@ -251,7 +468,9 @@ class NatsAdapter(EventAdapter):
     
     async def _reconnected_callback(self) -> None:
         """Called when reconnected to NATS."""
-        logger.info(f"Reconnected to NATS server: {self._client.connected_url}")
+        # The pooled connection may outlive the adapter that opened it
+        client = _loop_pool().clients.get(self._pool_key, self._client)
+        logger.info(f"Reconnected to NATS server: {client.connected_url if client else self._url}")
     
     async def _closed_callback(self) -> None:
         """Called when NATS connection is closed."""
@@ -1,9 +1,11 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sse_starlette.sse import EventSourceResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from soorma_common.tenancy import DEFAULT_PLATFORM_TENANT_ID
 
-from ...models.schemas import PublishRequest, PublishResponse
+from ...models.schemas import PublishRequest, PublishResponse, encode_event_payload
 from ...services.event_manager import event_manager
 from ..dependencies import get_platform_tenant_id
 
@@ -12,6 +14,13 @@ logger = logging.getLogger(__name__)
 
 MAX_IDENTITY_LEN = 64
 
+# Keep SSE responses unbuffered and uncached by clients and proxies
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
 
 def _normalize_identity(value: str | None) -> str | None:
     """Normalize identity values: trim whitespace, map empty to None."""
@@ -29,9 +38,41 @@ def _validate_identity_length(field_name: str, value: str | None) -> None:
             detail=f"{field_name} must be at most {MAX_IDENTITY_LEN} characters",
         )
 
-@router.post("/publish", response_model=PublishResponse)
+async def _decode_publish_request(request: Request) -> PublishRequest:
+    """Validate the raw JSON body straight into a PublishRequest.
+
+    ``model_validate_json`` parses and validates in one pass inside
+    pydantic-core, skipping the intermediate ``json.loads`` dict FastAPI
+    would otherwise build for a declared body parameter.
+    """
+    try:
+        return PublishRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        ) from e
+
+
+@router.post(
+    "/publish",
+    response_model=PublishResponse,
+    # The body is decoded by _decode_publish_request, so document it here
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/PublishRequest"},
+                },
+            },
+        },
+    },
+)
 async def publish_event(
-    request: PublishRequest,
+    request: PublishRequest = Depends(_decode_publish_request),
     platform_tenant_id: str = Depends(get_platform_tenant_id),
 ) -> PublishResponse:
     """
@@ -73,17 +114,18 @@ async def publish_event(
         event.user_id = sanitized_user_id
 
         # Build the message payload
-        # Use model_dump to preserve field names (e.g. correlation_id) for SDK compatibility
+        # Keep model field names (e.g. correlation_id) for SDK compatibility;
         # to_cloudevents_dict() converts to strict CloudEvents (lowercase keys) which breaks SDK
-        message = event.model_dump(mode='json', exclude_none=True)
+        # Encoded once here; the adapter puts these bytes on the bus unchanged
+        payload = encode_event_payload(event)
         
         # Publish via event manager
         # Ensure we pass the string value of the topic, not the Enum object
         # This prevents "EventTopic.BUSINESS_FACTS" from being used in the subject
         topic_str = event.topic.value if hasattr(event.topic, "value") else str(event.topic)
-        await event_manager.publish(topic_str, message)
+        await event_manager.publish_bytes(topic_str, payload)
         
-        logger.info(f"Published event {event.id} to topic {topic_str}")
+        logger.info("Published event %s to topic %s", event.id, topic_str)
         
         return PublishResponse(
             success=True,
@@ -96,7 +138,7 @@ async def publish_event(
         # Adapter not initialized/connected
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to publish event: {e}")
+        logger.error("Failed to publish event: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to publish event: {str(e)}",
@@ -118,7 +160,7 @@ async def stream_events(
         None,
         description="Name of the agent (used for load balancing queue groups)"
     ),
-) -> EventSourceResponse:
+) -> StreamingResponse:
     """
     Subscribe to events via Server-Sent Events (SSE).
     """
@@ -128,13 +170,16 @@ async def stream_events(
         raise HTTPException(status_code=400, detail="At least one topic is required")
     
     try:
-        return EventSourceResponse(
+        # create_stream yields pre-formatted SSE frames as bytes
+        return StreamingResponse(
             event_manager.create_stream(
                 topics=topic_list, 
                 agent_id=agent_id,
                 agent_name=agent_name,
                 check_disconnected=request.is_disconnected
-            )
+            ),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
         )
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
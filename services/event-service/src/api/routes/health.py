@@ -1,20 +1,27 @@
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from ...models.schemas import HealthResponse
 from ...services.event_manager import event_manager
 
 router = APIRouter(tags=["Health"])
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint.
     
     Returns service status, adapter connection state, and active streams count.
+    The body is encoded directly; returning a Response skips response_model
+    validation, which stays declared for the OpenAPI schema.
     """
     adapter = event_manager.adapter
-    return HealthResponse(
-        status="healthy" if adapter and adapter.is_connected else "degraded",
-        adapter=adapter.name if adapter else "none",
-        connected=adapter.is_connected if adapter else False,
-        active_streams=len(event_manager.active_connections),
+    connected = adapter.is_connected if adapter else False
+    return Response(
+        content=orjson.dumps({
+            "status": "healthy" if connected else "degraded",
+            "adapter": adapter.name if adapter else "none",
+            "connected": connected,
+            "active_streams": len(event_manager.active_connections),
+        }),
+        media_type="application/json",
     )
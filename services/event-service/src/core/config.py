@@ -41,6 +41,9 @@ class Settings(BaseSettings):
     # Stream settings
     stream_heartbeat_interval: int = 15  # seconds
     stream_max_queue_size: int = 1000
+    stream_batch_max: int = 100  # messages written per SSE chunk
+    stream_batch_max_bytes: int = 16384  # a chunk is written once it reaches this size
+    stream_batch_linger_ms: float = 0  # wait for more messages before writing a chunk
 
 
 # Global settings instance
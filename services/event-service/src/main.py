@@ -12,15 +12,18 @@ Key Features:
 """
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Dict
+from typing import AsyncGenerator, Dict, Type
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 from soorma_common import __version__
 from soorma_service_common import TenancyMiddleware, configure_platform_tenant_openapi
 
 from .core.config import settings
 from .services.event_manager import event_manager
+from .models.schemas import PublishRequest
 from .api.routes import events, health, admin
 
 # Configure logging
@@ -30,6 +33,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Body of every 500 outside debug mode; constant, so encoded once
+_GENERIC_ERROR_BODY = orjson.dumps({
+    "error": "Internal server error",
+    "detail": "An unexpected error occurred",
+})
+
 
 # =============================================================================
 # Application Lifecycle
@@ -52,6 +61,40 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await event_manager.shutdown()
 
 
+# =============================================================================
+# OpenAPI
+# =============================================================================
+
+
+def _document_request_models(app: FastAPI, *models: Type[BaseModel]) -> None:
+    """
+    Add request models to the OpenAPI components.
+    
+    Routes that decode their own body reference these schemas through
+    ``openapi_extra``; FastAPI only registers models it parses itself.
+    """
+    original_openapi = app.openapi
+
+    def custom_openapi():
+        if app.openapi_schema:
+            return app.openapi_schema
+
+        schema = original_openapi()
+        schemas = schema.setdefault("components", {}).setdefault("schemas", {})
+        for model in models:
+            model_schema = model.model_json_schema(
+                ref_template="#/components/schemas/{model}"
+            )
+            for name, definition in model_schema.pop("$defs", {}).items():
+                schemas.setdefault(name, definition)
+            schemas[model.__name__] = model_schema
+
+        app.openapi_schema = schema
+        return schema
+
+    app.openapi = custom_openapi
+
+
 # =============================================================================
 # FastAPI Application
 # =============================================================================
@@ -76,6 +119,7 @@ app.add_middleware(
 # Add tenancy middleware
 app.add_middleware(TenancyMiddleware)
 configure_platform_tenant_openapi(app)
+_document_request_models(app, PublishRequest)
 
 # Include routers
 app.include_router(health.router)
@@ -99,10 +143,14 @@ async def root() -> Dict[str, str]:
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled error: {exc}", exc_info=True)
-    return {
-        "error": "Internal server error",
-        "detail": str(exc) if settings.debug else "An unexpected error occurred",
-    }
+    logger.error("Unhandled error: %s", exc, exc_info=True)
+    if settings.debug:
+        body = orjson.dumps({
+            "error": "Internal server error",
+            "detail": str(exc),
+        })
+    else:
+        body = _GENERIC_ERROR_BODY
+    return Response(content=body, status_code=500, media_type="application/json")
@@ -2,10 +2,25 @@ from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 from soorma_common.events import EventEnvelope
 
-# Use EventEnvelope from shared library as the payload model
+# Use EventEnvelope from shared library as the payload model.
+# It stays the shared model rather than a slimmer local copy: pydantic only
+# runs the id/correlation_id default factories when a field is missing, and
+# BaseModel instances keep a __dict__ regardless of config, so a fork would
+# save nothing while drifting from the SDK's envelope.
 EventPayload = EventEnvelope
 
 
+def encode_event_payload(event: EventPayload) -> bytes:
+    """
+    Serialize an event to the JSON bytes published on the bus.
+    
+    Field names (e.g. correlation_id) are kept as-is for SDK compatibility
+    and None fields are omitted. model_dump_json serializes in pydantic-core
+    without building an intermediate dict.
+    """
+    return event.model_dump_json(exclude_none=True).encode()
+
+
 class PublishRequest(BaseModel):
     """Request to publish an event."""
     event: EventPayload = Field(..., description="Event to publish")
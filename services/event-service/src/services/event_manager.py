@@ -1,8 +1,12 @@
 import asyncio
-import json
+import itertools
 import logging
-from typing import Any, AsyncGenerator, Dict, List, Optional
-from uuid import uuid4
+import os
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, FrozenSet, List, Optional, Tuple
+
+import orjson
 
 from ..core.config import settings
 from ..adapters.base import EventAdapter
@@ -11,6 +15,145 @@ from ..adapters.memory_adapter import MemoryAdapter
 
 logger = logging.getLogger(__name__)
 
+# Connection IDs only need to be unique within this process (they key
+# active_connections and adapter subscriptions), so a counter behind a
+# pid/start-time prefix is enough and avoids os.urandom per connection.
+_PROC_PREFIX = f"{os.getpid()}-{int(time.time())}"
+_conn_counter = itertools.count()
+
+
+def _append_sse_frame(buf: bytearray, event: bytes, data: bytes) -> None:
+    """
+    Append one SSE frame to a buffer.
+    
+    Multi-line payloads (e.g. pretty-printed JSON from another publisher)
+    are split across ``data:`` lines as the SSE format requires.
+    """
+    if b"\n" in data or b"\r" in data:
+        data = b"\ndata: ".join(data.splitlines())
+    buf += b"event: "
+    buf += event
+    buf += b"\ndata: "
+    buf += data
+    buf += b"\n\n"
+
+
+def _sse_frame(buf: bytearray, event: bytes, data: bytes) -> bytes:
+    """Format one SSE frame into the connection's reusable buffer."""
+    buf.clear()
+    _append_sse_frame(buf, event, data)
+    return bytes(buf)
+
+
+class _MessageFrames:
+    """
+    Formats ``message`` SSE frames, reusing the last one for the same payload.
+    
+    Fan-outs of one publish receive the same payload object back to back,
+    so each message is framed once however many streams it reaches. The
+    cache holds a reference to the payload, so an identity match is exact.
+    """
+    
+    __slots__ = ("_payload", "_frame")
+    
+    def __init__(self):
+        self._payload: Optional[bytes] = None
+        self._frame = b""
+    
+    def frame(self, payload: bytes) -> bytes:
+        """Return the complete SSE frame for a message payload."""
+        if payload is not self._payload:
+            buf = bytearray()
+            _append_sse_frame(buf, b"message", payload)
+            self._frame = bytes(buf)
+            self._payload = payload
+        return self._frame
+
+
+_message_frames = _MessageFrames()
+
+
+# Streams sharing a fan-out: (subscribed topics, queue group)
+_FanoutKey = Tuple[FrozenSet[str], str]
+
+
+class _ConnRecord:
+    """Registry entry for an active SSE connection."""
+    
+    __slots__ = ("agent_id", "topics", "buffer", "notify", "dropped")
+    
+    def __init__(
+        self,
+        agent_id: str,
+        topics: List[str],
+        buffer: Deque[bytes],
+        notify: asyncio.Event,
+    ):
+        self.agent_id = agent_id
+        self.topics = topics
+        self.buffer = buffer
+        # Wakes the stream loop; also set by the heartbeat ticker
+        self.notify = notify
+        # Messages evicted from the full buffer before the client read them
+        self.dropped = 0
+
+
+class _Fanout:
+    """
+    One adapter subscription shared by the local streams of a topic set.
+    
+    Streams with the same topics and queue group receive the same deliveries,
+    so they share a single subscription instead of one each. Every stream
+    has a queue group (its agent_name, else its agent_id), so a message goes
+    to one member (round-robin), as the bus would do.
+    """
+    
+    __slots__ = ("queue_group", "members", "subscription_id", "ready")
+    
+    def __init__(self, queue_group: str):
+        self.queue_group = queue_group
+        # Next in line first
+        self.members: Deque[_ConnRecord] = deque()
+        # Set by the stream that subscribes; None if that failed
+        self.subscription_id: Optional[str] = None
+        self.ready = asyncio.Event()
+    
+    def remove(self, member: _ConnRecord) -> bool:
+        """Remove a member; returns whether it was present."""
+        try:
+            self.members.remove(member)
+        except ValueError:
+            return False
+        return True
+    
+    async def deliver(self, topic: str, data: bytes) -> None:
+        """
+        Raw adapter handler: buffer the message frame for the next member.
+        
+        Adapters await handlers, so it stays async, but it never awaits: it
+        completes in one step, and the bounded deques drop their oldest
+        entry on append instead of a full()/get_nowait()/put() sequence.
+        Each eviction is counted on the member's record.
+        """
+        # The member is served inline with a non-blocking deque append, so a
+        # slow client only fills (and trims) its own buffer.
+        members = self.members
+        if not members:
+            # The last stream left before the subscription was removed
+            logger.warning(
+                "Dropping message on %s: no streams left in group %s",
+                topic, self.queue_group,
+            )
+            return
+        member = members[0]
+        members.rotate(-1)
+        buffer = member.buffer
+        if len(buffer) == buffer.maxlen:
+            member.dropped += 1
+        buffer.append(_message_frames.frame(data))
+        member.notify.set()
+
+
 class EventManager:
     """
     Manages the event adapter and SSE connections.
@@ -19,8 +162,20 @@ class EventManager:
     
     def __init__(self):
         self.adapter: Optional[EventAdapter] = None
-        # Active SSE connections: connection_id -> connection_data
-        self.active_connections: Dict[str, Dict[str, Any]] = {}
+        # Active SSE connections: connection_id -> connection record
+        self.active_connections: Dict[str, _ConnRecord] = {}
+        # Admin view of active_connections, rebuilt only after it changes
+        self._connection_summary: List[Dict[str, Any]] = []
+        self._summary_dirty = True
+        # JSON body of the admin view and the summary list it encodes
+        self._summary_json = b""
+        self._summary_json_source: Optional[List[Dict[str, Any]]] = None
+        # Shared adapter subscriptions of the active streams
+        self._fanouts: Dict[_FanoutKey, _Fanout] = {}
+        # Set by shutdown() to end every stream
+        self._shutdown = asyncio.Event()
+        # Wakes all streams each heartbeat interval while any are active
+        self._heartbeat_task: Optional[asyncio.Task] = None
 
     def _get_adapter(self) -> EventAdapter:
         """Factory function to create the appropriate adapter based on configuration."""
@@ -39,14 +194,15 @@ class EventManager:
 
     async def initialize(self):
         """Initialize and connect the adapter."""
-        logger.info(f"Starting Event Service with {settings.event_adapter} adapter")
+        logger.info("Starting Event Service with %s adapter", settings.event_adapter)
         self.adapter = self._get_adapter()
+        self._shutdown.clear()
         
         try:
             await self.adapter.connect()
-            logger.info(f"Event Service ready on port {settings.service_port}")
+            logger.info("Event Service ready on port %s", settings.service_port)
         except Exception as e:
-            logger.error(f"Failed to connect adapter: {e}")
+            logger.error("Failed to connect adapter: %s", e)
             # Continue anyway for graceful degradation in dev mode
             if not settings.debug:
                 raise
@@ -55,14 +211,18 @@ class EventManager:
         """Shutdown adapter and close all connections."""
         logger.info("Shutting down Event Service")
         
-        # Close all SSE connections
-        for conn_id in list(self.active_connections.keys()):
-            try:
-                conn_data = self.active_connections.pop(conn_id, {})
-                if "cancel_event" in conn_data:
-                    conn_data["cancel_event"].set()
-            except Exception as e:
-                logger.warning(f"Error closing connection {conn_id}: {e}")
+        # Stop every SSE stream with one shared event, checked each time a
+        # stream wakes. Streams wait without a timeout, so wake them once.
+        self._shutdown.set()
+        for record in self.active_connections.values():
+            record.notify.set()
+        self.active_connections.clear()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        self._summary_dirty = True
+        # Their subscriptions go away with the adapter connection
+        self._fanouts.clear()
         
         # Disconnect adapter
         if self.adapter:
@@ -81,15 +241,143 @@ class EventManager:
         await self.adapter.publish(topic, message)
         return topic
 
+    async def publish_bytes(self, topic: str, payload: bytes) -> str:
+        """Publish an already JSON-encoded event."""
+        if not self.adapter:
+            raise RuntimeError("Event adapter not initialized")
+        
+        if not self.adapter.is_connected:
+            raise RuntimeError("Event adapter not connected")
+            
+        await self.adapter.publish_bytes(topic, payload)
+        return topic
+
+    async def publish_batch(self, items: List[Tuple[str, bytes]]) -> int:
+        """Publish several already JSON-encoded events; returns the count."""
+        if not self.adapter:
+            raise RuntimeError("Event adapter not initialized")
+        
+        if not self.adapter.is_connected:
+            raise RuntimeError("Event adapter not connected")
+            
+        await self.adapter.publish_batch(items)
+        return len(items)
+
+    async def _join_fanout(
+        self, key: _FanoutKey, topics: List[str], member: _ConnRecord
+    ) -> _Fanout:
+        """
+        Attach a stream to the fan-out for its topics and queue group.
+        
+        The first stream of a key subscribes on the adapter; later ones wait
+        for that subscription and share it.
+        """
+        fanout = self._fanouts.get(key)
+        if fanout is not None:
+            fanout.members.append(member)
+            try:
+                await fanout.ready.wait()
+            except BaseException:
+                fanout.remove(member)
+                raise
+            if fanout.subscription_id is None:
+                fanout.remove(member)
+                raise RuntimeError("Event adapter subscription failed")
+            return fanout
+        
+        fanout = _Fanout(key[1])
+        fanout.members.append(member)
+        self._fanouts[key] = fanout
+        try:
+            fanout.subscription_id = await self.adapter.subscribe(
+                topics=topics,
+                handler=fanout.deliver,
+                queue_group=key[1],
+                # Streams forward the payload as-is, so skip decoding it
+                deliver_raw=True,
+            )
+        except BaseException:
+            # Waiting streams see subscription_id None and give up too
+            if self._fanouts.get(key) is fanout:
+                del self._fanouts[key]
+            fanout.members.clear()
+            raise
+        finally:
+            fanout.ready.set()
+        return fanout
+
+    async def _leave_fanout(
+        self, key: _FanoutKey, fanout: _Fanout, member: _ConnRecord
+    ) -> None:
+        """Detach a stream, unsubscribing once the fan-out has no members."""
+        if not fanout.remove(member) or fanout.members:
+            return
+        
+        if self._fanouts.get(key) is fanout:
+            del self._fanouts[key]
+        if fanout.subscription_id and self.adapter:
+            await self.adapter.unsubscribe(fanout.subscription_id)
+
+    async def _heartbeat_ticker(self, interval: float) -> None:
+        """
+        Wake every active stream once per heartbeat interval.
+        
+        Streams that wake with nothing buffered send a heartbeat. One timer
+        here replaces a timeout per idle stream. The ticker is cancelled
+        when the last stream closes and create_stream starts it on demand.
+        """
+        while self.active_connections:
+            await asyncio.sleep(interval)
+            for record in self.active_connections.values():
+                record.notify.set()
+
+    def connection_summary(self) -> List[Dict[str, Any]]:
+        """
+        Return the admin view of active SSE connections.
+        
+        The list is cached and rebuilt only after a connection is added or
+        removed. The rebuild never awaits, so it cannot interleave with the
+        stream setup/cleanup paths that mark it dirty. Callers must not
+        mutate the returned list.
+        """
+        if self._summary_dirty:
+            self._connection_summary = [
+                {
+                    "connection_id": conn_id,
+                    "agent_id": record.agent_id,
+                    "topics": record.topics,
+                }
+                for conn_id, record in self.active_connections.items()
+            ]
+            self._summary_dirty = False
+        return self._connection_summary
+
+    def connection_summary_json(self) -> bytes:
+        """
+        Return the admin view as a JSON body (count and connections).
+        
+        Encoded once per rebuild of connection_summary().
+        """
+        connections = self.connection_summary()
+        if self._summary_json_source is not connections:
+            self._summary_json = orjson.dumps({
+                "count": len(connections),
+                "connections": connections,
+            })
+            self._summary_json_source = connections
+        return self._summary_json
+
     async def create_stream(
         self, 
         topics: List[str], 
         agent_id: str,
         agent_name: Optional[str] = None,
         check_disconnected: Optional[callable] = None
-    ) -> AsyncGenerator[Dict[str, str], None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Create an SSE stream generator.
+        
+        Yields fully formatted ``text/event-stream`` frames as bytes.
         """
         if not self.adapter:
             raise RuntimeError("Event adapter not initialized")
@@ -98,120 +386,146 @@ class EventManager:
             raise RuntimeError("Event adapter not connected")
             
         # Generate connection ID
-        connection_id = str(uuid4())
+        connection_id = f"{_PROC_PREFIX}-{next(_conn_counter)}"
+        # Data of the heartbeat and disconnected frames. Frames are built from
+        # orjson bytes and yielded as bytes, so nothing is re-encoded to str.
+        connection_payload = orjson.dumps({"connection_id": connection_id})
         
-        logger.info(f"New SSE connection {connection_id} from agent {agent_id} (name: {agent_name}) for topics: {topics}")
-        
-        # Create a queue for this connection
-        queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(
-            maxsize=settings.stream_max_queue_size
+        logger.info(
+            "New SSE connection %s from agent %s (name: %s) for topics: %s",
+            connection_id, agent_id, agent_name, topics,
         )
-        cancel_event = asyncio.Event()
-        subscription_id: Optional[str] = None
+        
+        # Per-connection buffer of message frames. The deque drops the oldest
+        # entry when full; `notify` wakes the stream loop after an append.
+        # A queue size of 0 means unbounded, as with asyncio.Queue.
+        buffer: Deque[bytes] = deque(maxlen=settings.stream_max_queue_size or None)
+        notify = asyncio.Event()
+        # Outbound frames are assembled here, reusing its allocation
+        frame_buf = bytearray()
+        shutdown = self._shutdown
+        stream_closed = False
         
         # Store connection info
-        self.active_connections[connection_id] = {
-            "agent_id": agent_id,
-            "topics": topics,
-            "queue": queue,
-            "cancel_event": cancel_event,
-        }
+        record = _ConnRecord(agent_id, topics, buffer, notify)
+        self.active_connections[connection_id] = record
+        self._summary_dirty = True
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(
+                self._heartbeat_ticker(settings.stream_heartbeat_interval)
+            )
+        
+        # Use agent_name as queue_group if provided, otherwise fallback to agent_id.
+        # This enables load balancing across multiple instances of the same logical agent.
+        queue_group = agent_name if agent_name else agent_id
+        fanout_key: _FanoutKey = (frozenset(topics), queue_group)
+        fanout: Optional[_Fanout] = None
         
         try:
-            # Message handler that puts messages in the queue
-            async def queue_handler(topic: str, message: Dict[str, Any]) -> None:
-                try:
-                    # Don't block if queue is full (drop oldest messages)
-                    if queue.full():
-                        try:
-                            queue.get_nowait()
-                        except asyncio.QueueEmpty:
-                            pass
-                    await queue.put({"topic": topic, "message": message})
-                except Exception as e:
-                    logger.error(f"Error queuing message: {e}")
+            # Subscribe to topics, sharing the adapter subscription of any
+            # local stream with the same topics and queue group
+            fanout = await self._join_fanout(fanout_key, topics, record)
             
-            # Subscribe to topics
-            # Use agent_name as queue_group if provided, otherwise fallback to agent_id.
-            # This enables load balancing across multiple instances of the same logical agent.
-            queue_group = agent_name if agent_name else agent_id
-            
-            subscription_id = await self.adapter.subscribe(
-                topics=topics,
-                handler=queue_handler,
-                subscription_id=connection_id,
-                queue_group=queue_group,
+            logger.info(
+                "Subscription %s active for connection %s [group: %s]",
+                fanout.subscription_id, connection_id, queue_group,
             )
             
-            logger.info(f"Subscription {subscription_id} active for connection {connection_id} [group: {queue_group}]")
-            
             # Send initial connection event
-            yield {
-                "event": "connected",
-                "data": json.dumps({
-                    "connection_id": connection_id,
-                    "topics": topics,
-                    "agent_id": agent_id,
-                }),
-            }
+            yield _sse_frame(frame_buf, b"connected", orjson.dumps({
+                "connection_id": connection_id,
+                "topics": topics,
+                "agent_id": agent_id,
+            }))
             
-            # Stream events from the queue
-            heartbeat_interval = settings.stream_heartbeat_interval
+            # Stream events from the queue. Settings are bound to locals once
+            # per connection rather than frozen at import, so overrides made
+            # after startup (e.g. in tests) still apply to new streams.
+            batch_max = settings.stream_batch_max
+            batch_max_bytes = settings.stream_batch_max_bytes
+            batch_linger = settings.stream_batch_linger_ms / 1000
+            # Identical for the life of the connection, so built once
+            heartbeat_frame = _sse_frame(bytearray(), b"heartbeat", connection_payload)
             
-            while not cancel_event.is_set():
+            while not shutdown.is_set():
                 try:
-                    # Check if client disconnected
-                    if check_disconnected and await check_disconnected():
-                        logger.info(f"Client {connection_id} disconnected")
-                        break
-
-                    # Wait for message with timeout (for heartbeat)
-                    try:
-                        item = await asyncio.wait_for(
-                            queue.get(),
-                            timeout=heartbeat_interval,
-                        )
-                        
-                        # Yield the event
-                        yield {
-                            "event": "message",
-                            "data": json.dumps(item["message"]),
-                        }
-                        
-                    except asyncio.TimeoutError:
-                        # Send heartbeat to keep connection alive
-                        yield {
-                            "event": "heartbeat",
-                            "data": json.dumps({"connection_id": connection_id}),
-                        }
+                    # Wait for a message or the heartbeat ticker
+                    if not buffer:
+                        notify.clear()
+                        await notify.wait()
+                        if shutdown.is_set():
+                            break
+                        if not buffer:
+                            # Check for a gone client only when idle; while
+                            # messages flow, a dead socket fails the next send
+                            if check_disconnected and await check_disconnected():
+                                logger.info("Client %s disconnected", connection_id)
+                                break
+                            
+                            # Send heartbeat to keep connection alive
+                            yield heartbeat_frame
+                            continue
+                    
+                    # Give a burst a moment to accumulate before flushing
+                    if batch_linger and len(buffer) < batch_max:
+                        await asyncio.sleep(batch_linger)
+                    
+                    # Write up to batch_max frames (or batch_max_bytes) as one
+                    # chunk (one send), then loop to re-check cancellation
+                    # before the rest. Each message is still its own SSE event
+                    # for clients. Control frames are always sent on their own.
+                    if len(buffer) == 1:
+                        # Frames are pre-built, so a lone one is sent as is
+                        yield buffer.popleft()
+                        continue
+                    frame_buf.clear()
+                    for _ in range(min(len(buffer), batch_max)):
+                        frame_buf += buffer.popleft()
+                        if len(frame_buf) >= batch_max_bytes:
+                            break
+                    yield bytes(frame_buf)
                 
                 except asyncio.CancelledError:
-                    logger.info(f"Stream cancelled for connection {connection_id}")
+                    logger.info("Stream cancelled for connection %s", connection_id)
                     break
                 except Exception as e:
-                    logger.error(f"Error in event stream {connection_id}: {e}")
+                    logger.error("Error in event stream %s: %s", connection_id, e)
                     break
         
+        except GeneratorExit:
+            # Closed by the consumer (e.g. response torn down); the generator
+            # must not yield again
+            stream_closed = True
+            raise
+        
         finally:
             # Cleanup
-            logger.info(f"Cleaning up connection {connection_id}")
+            logger.info("Cleaning up connection %s", connection_id)
             
-            # Unsubscribe
-            if subscription_id and self.adapter:
+            # Unsubscribe (the last stream of a fan-out drops its subscription)
+            if fanout is not None:
                 try:
-                    await self.adapter.unsubscribe(subscription_id)
+                    await self._leave_fanout(fanout_key, fanout, record)
                 except Exception as e:
-                    logger.warning(f"Error unsubscribing {subscription_id}: {e}")
+                    logger.warning("Error unsubscribing %s: %s", fanout.subscription_id, e)
+            
+            if record.dropped:
+                logger.warning(
+                    "Connection %s dropped %d messages from a full buffer (slow consumer)",
+                    connection_id, record.dropped,
+                )
             
             # Remove from active connections
-            self.active_connections.pop(connection_id, None)
+            if self.active_connections.pop(connection_id, None) is not None:
+                self._summary_dirty = True
+            if not self.active_connections and self._heartbeat_task is not None:
+                self._heartbeat_task.cancel()
+                self._heartbeat_task = None
             
             # Send disconnect event (if possible)
             try:
-                yield {
-                    "event": "disconnected",
-                    "data": json.dumps({"connection_id": connection_id}),
-                }
+                if not stream_closed:
+                    yield _sse_frame(frame_buf, b"disconnected", connection_payload)
             except Exception:
                 pass
 
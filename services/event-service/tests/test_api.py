@@ -150,3 +150,30 @@ class TestAdminEndpoints:
         assert "count" in data
         assert "connections" in data
         assert isinstance(data["connections"], list)
+
+
+class TestGlobalExceptionHandler:
+    """Tests for the unhandled-error handler."""
+    
+    async def test_generic_body_outside_debug(self, monkeypatch):
+        """Test that non-debug 500s hide the exception text."""
+        from src.core.config import settings
+        from src.main import global_exception_handler
+        
+        monkeypatch.setattr(settings, "debug", False)
+        response = await global_exception_handler(None, ValueError("secret"))
+        
+        assert response.status_code == 500
+        assert response.media_type == "application/json"
+        assert b"secret" not in response.body
+    
+    async def test_debug_body_includes_detail(self, monkeypatch):
+        """Test that debug 500s report the exception text."""
+        from src.core.config import settings
+        from src.main import global_exception_handler
+        
+        monkeypatch.setattr(settings, "debug", True)
+        response = await global_exception_handler(None, ValueError("boom"))
+        
+        assert response.status_code == 500
+        assert b'"detail":"boom"' in response.body
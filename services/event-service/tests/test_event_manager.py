@@ -0,0 +1,255 @@
+"""
+Tests for EventManager SSE stream generation.
+"""
+import logging
+
+import orjson
+import pytest
+from src.adapters.memory_adapter import MemoryAdapter
+from src.core.config import settings
+from src.services.event_manager import EventManager, _Fanout
+
+
+@pytest.fixture
+async def manager():
+    """EventManager wired to a connected memory adapter."""
+    manager = EventManager()
+    manager.adapter = MemoryAdapter()
+    await manager.adapter.connect()
+    yield manager
+    await manager.adapter.disconnect()
+
+
+async def test_idle_stream_sends_heartbeat(manager, monkeypatch):
+    """Test that an idle stream emits a heartbeat after the interval."""
+    monkeypatch.setattr(settings, "stream_heartbeat_interval", 0.01)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+
+    assert (await stream.__anext__()).startswith(b"event: connected")
+    assert (await stream.__anext__()).startswith(b"event: heartbeat\ndata: {\"connection_id\":")
+
+    await stream.aclose()
+    assert manager.active_connections == {}
+
+
+async def test_heartbeat_frame_built_once(manager, monkeypatch):
+    """Test that a connection's heartbeats reuse one pre-encoded frame."""
+    monkeypatch.setattr(settings, "stream_heartbeat_interval", 0.01)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+
+    first = await stream.__anext__()
+    second = await stream.__anext__()
+    assert first is second
+
+    await stream.aclose()
+
+
+async def test_buffered_messages_stream_in_order(manager):
+    """Test that messages buffered between wakeups are written together, in order."""
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+
+    for i in range(3):
+        await manager.publish("test.topic", {"id": i})
+
+    # Everything buffered since the last wakeup is written as one chunk
+    chunk = await stream.__anext__()
+    assert chunk == b"".join(
+        b'event: message\ndata: {"id":%d}\n\n' % i for i in range(3)
+    )
+
+    await stream.aclose()
+
+
+async def test_chunks_respect_batch_max(manager, monkeypatch):
+    """Test that a backlog is split into chunks of at most stream_batch_max frames."""
+    monkeypatch.setattr(settings, "stream_batch_max", 2)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+
+    for i in range(3):
+        await manager.publish("test.topic", {"id": i})
+
+    first = await stream.__anext__()
+    second = await stream.__anext__()
+    assert first.count(b"event: message") == 2
+    assert second == b'event: message\ndata: {"id":2}\n\n'
+
+    await stream.aclose()
+
+
+async def test_chunks_respect_batch_max_bytes(manager, monkeypatch):
+    """Test that a chunk is written once it reaches stream_batch_max_bytes."""
+    frame = b'event: message\ndata: {"id":0}\n\n'
+    monkeypatch.setattr(settings, "stream_batch_max_bytes", len(frame) + 1)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+
+    for i in range(3):
+        await manager.publish("test.topic", {"id": i})
+
+    # The size check runs after each frame, so a chunk may overshoot by one
+    first = await stream.__anext__()
+    second = await stream.__anext__()
+    assert first.count(b"event: message") == 2
+    assert second == b'event: message\ndata: {"id":2}\n\n'
+
+    await stream.aclose()
+
+
+async def test_connection_summary_tracks_streams(manager):
+    """Test that the cached connection summary follows streams opening and closing."""
+    assert manager.connection_summary() == []
+
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+
+    summary = manager.connection_summary()
+    assert [(c["agent_id"], c["topics"]) for c in summary] == [("agent-1", ["test.topic"])]
+    # Unchanged registry: the cached list is reused
+    assert manager.connection_summary() is summary
+    body = manager.connection_summary_json()
+    assert orjson.loads(body) == {"count": 1, "connections": summary}
+    assert manager.connection_summary_json() is body
+
+    await stream.aclose()
+    assert manager.connection_summary() == []
+
+
+async def test_streams_share_fanout_subscription(manager):
+    """Test that streams with the same topics and group share one adapter subscription."""
+    streams = [
+        manager.create_stream(["b.topic", "a.topic"], agent_id=f"worker-{i}", agent_name="worker")
+        for i in range(2)
+    ]
+    streams.append(manager.create_stream(["a.topic", "b.topic"], agent_id="worker-2", agent_name="worker"))
+    for stream in streams:
+        await stream.__anext__()
+
+    assert len(manager.adapter._subscriptions) == 1
+
+    # Closing a member keeps the subscription until the last one leaves
+    await streams[0].aclose()
+    assert len(manager.adapter._subscriptions) == 1
+    for stream in streams[1:]:
+        await stream.aclose()
+    assert manager.adapter._subscriptions == {}
+
+
+async def test_fanouts_of_different_groups_each_receive(manager):
+    """Test that streams of different agents each get every message."""
+    streams = [
+        manager.create_stream(["test.topic"], agent_id=f"agent-{i}")
+        for i in range(2)
+    ]
+    for stream in streams:
+        await stream.__anext__()
+
+    await manager.publish("test.topic", {"id": 1})
+
+    for stream in streams:
+        assert await stream.__anext__() == b'event: message\ndata: {"id":1}\n\n'
+        await stream.aclose()
+
+
+async def test_shutdown_ends_streams(manager, monkeypatch):
+    """Test that shutdown clears the registry and stops streams on their next wakeup."""
+    monkeypatch.setattr(settings, "stream_heartbeat_interval", 0.01)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+
+    await manager.shutdown()
+    assert manager.active_connections == {}
+
+    assert (await stream.__anext__()).startswith(b"event: disconnected")
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+async def test_streams_share_heartbeat_ticker(manager, monkeypatch):
+    """Test that idle streams are woken by one ticker that stops with the last stream."""
+    monkeypatch.setattr(settings, "stream_heartbeat_interval", 0.01)
+    streams = [
+        manager.create_stream(["test.topic"], agent_id=f"agent-{i}")
+        for i in range(3)
+    ]
+    for stream in streams:
+        await stream.__anext__()
+    ticker = manager._heartbeat_task
+    assert ticker is not None
+
+    for stream in streams:
+        assert (await stream.__anext__()).startswith(b"event: heartbeat")
+    assert manager._heartbeat_task is ticker
+
+    for stream in streams:
+        await stream.aclose()
+    assert manager._heartbeat_task is None
+
+
+async def test_message_frame_shared_across_streams(manager):
+    """Test that one publish is framed once for every stream it reaches."""
+    streams = [
+        manager.create_stream(["test.topic"], agent_id=f"agent-{i}")
+        for i in range(2)
+    ]
+    for stream in streams:
+        await stream.__anext__()
+
+    await manager.publish("test.topic", {"id": 1})
+
+    first, second = [await stream.__anext__() for stream in streams]
+    assert first == b'event: message\ndata: {"id":1}\n\n'
+    assert first is second
+
+    for stream in streams:
+        await stream.aclose()
+
+
+async def test_full_buffer_drops_oldest_and_counts(manager, monkeypatch):
+    """Test that a slow stream keeps the newest messages and counts evictions."""
+    monkeypatch.setattr(settings, "stream_max_queue_size", 2)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+    (record,) = manager.active_connections.values()
+
+    for i in range(5):
+        await manager.publish("test.topic", {"id": i})
+
+    assert record.dropped == 3
+    chunk = await stream.__anext__()
+    assert chunk == b"".join(
+        b'event: message\ndata: {"id":%d}\n\n' % i for i in (3, 4)
+    )
+
+    await stream.aclose()
+
+
+async def test_zero_queue_size_is_unbounded(manager, monkeypatch):
+    """Test that stream_max_queue_size=0 buffers every message without drops."""
+    monkeypatch.setattr(settings, "stream_max_queue_size", 0)
+    stream = manager.create_stream(["test.topic"], agent_id="agent-1")
+    await stream.__anext__()
+    (record,) = manager.active_connections.values()
+
+    for i in range(5):
+        await manager.publish("test.topic", {"id": i})
+
+    assert record.dropped == 0
+    chunk = await stream.__anext__()
+    assert chunk == b"".join(
+        b'event: message\ndata: {"id":%d}\n\n' % i for i in range(5)
+    )
+
+    await stream.aclose()
+
+
+async def test_delivery_to_empty_fanout_is_logged(caplog):
+    """Test that a message reaching a fanout with no streams left is not lost silently."""
+    fanout = _Fanout("agent-1")
+
+    with caplog.at_level(logging.WARNING):
+        await fanout.deliver("test.topic", b'{"id":1}')
+
+    assert "no streams left in group agent-1" in caplog.text
@@ -1,6 +1,8 @@
 """
 Tests for the Memory Adapter.
 """
+import asyncio
+
 import pytest
 from src.adapters.memory_adapter import MemoryAdapter
 
@@ -131,6 +133,37 @@ class TestMemoryAdapter:
         assert len(received) == 1
         assert received[0] == "exact.topic.name"
     
+    async def test_pattern_tokens_are_literal(self, adapter):
+        """Test that regex metacharacters in patterns are matched literally."""
+        received = []
+        
+        async def handler(topic, message):
+            received.append(topic)
+        
+        await adapter.subscribe(["tenant+1.(orders).*"], handler)
+        
+        await adapter.publish("tenant+1.(orders).created", {"test": 1})
+        await adapter.publish("tenant1.orders.created", {"test": 2})
+        await adapter.publish("tenantt1.(orders).created", {"test": 3})
+        
+        assert received == ["tenant+1.(orders).created"]
+    
+    async def test_subscribe_after_publish(self, adapter):
+        """Test that new subscriptions see topics that were already published."""
+        received = []
+        
+        async def handler(topic, message):
+            received.append(message)
+        
+        await adapter.subscribe(["orders.*"], handler)
+        await adapter.publish("orders.created", {"msg": 1})
+        
+        # A later subscription must not be hidden by earlier match results
+        await adapter.subscribe(["orders.created"], handler)
+        await adapter.publish("orders.created", {"msg": 2})
+        
+        assert received == [{"msg": 1}, {"msg": 2}, {"msg": 2}]
+    
     async def test_multiple_topics(self, adapter):
         """Test subscribing to multiple topics."""
         received = []
@@ -167,7 +200,161 @@ class TestMemoryAdapter:
         # Both handlers should receive the message
         assert len(received_a) == 1
         assert len(received_b) == 1
-    
+
+    async def test_subscribers_share_encoded_message(self, adapter):
+        """Test that fan-out delivers one message whose JSON is encoded once."""
+        received = []
+
+        async def handler(topic, message):
+            received.append(message)
+
+        await adapter.subscribe(["test-topic"], handler)
+        await adapter.subscribe(["test-topic"], handler)
+
+        await adapter.publish("test-topic", {"key": "value"})
+
+        assert len(received) == 2
+        assert received[0] is received[1]
+        assert received[0].to_json() == b'{"key":"value"}'
+        assert received[1].to_json() is received[0].to_json()
+
+    async def test_publish_bytes(self, adapter):
+        """Test that pre-encoded payloads are decoded for handlers and kept as-is."""
+        received = []
+
+        async def handler(topic, message):
+            received.append(message)
+
+        await adapter.subscribe(["test-topic"], handler)
+
+        await adapter.publish_bytes("test-topic", b'{"key": "value"}')
+
+        assert received == [{"key": "value"}]
+        assert received[0].to_json() == b'{"key": "value"}'
+
+    async def test_deliver_raw(self, adapter):
+        """Test that raw subscribers get the JSON bytes alongside dict subscribers."""
+        received = []
+
+        async def handler(topic, message):
+            received.append(message)
+
+        await adapter.subscribe(["test-topic"], handler, deliver_raw=True)
+        await adapter.subscribe(["test-topic"], handler)
+
+        await adapter.publish("test-topic", {"key": "value"})
+
+        assert sorted(received, key=lambda m: isinstance(m, dict)) == [
+            b'{"key":"value"}',
+            {"key": "value"},
+        ]
+
+    async def test_predicate_filters_messages(self, adapter):
+        """Test that a subscription predicate filters before delivery."""
+        received = []
+
+        async def handler(topic, message):
+            received.append(message["id"])
+
+        await adapter.subscribe(
+            ["test-topic"], handler, predicate=lambda m: m["id"] % 2 == 0
+        )
+
+        for i in range(5):
+            await adapter.publish("test-topic", {"id": i})
+
+        assert received == [0, 2, 4]
+
+    async def test_failing_predicate_rejects(self, adapter):
+        """Test that a predicate error skips that subscription only."""
+        received = []
+
+        async def handler(topic, message):
+            received.append(message)
+
+        await adapter.subscribe(["test-topic"], handler, predicate=lambda m: m["missing"])
+        await adapter.subscribe(["test-topic"], handler)
+
+        await adapter.publish("test-topic", {"id": 1})
+
+        assert received == [{"id": 1}]
+
+    async def test_handler_call_error_raises_and_closes(self, adapter):
+        """Test that a failing handler call reaches the publisher, unawaited coroutines closed."""
+        created = []
+
+        async def deliver():
+            pass
+
+        def handler(topic, message):
+            created.append(deliver())
+            return created[-1]
+
+        def broken_handler(topic, message):
+            raise ValueError("cannot build delivery")
+
+        await adapter.subscribe(["test-topic"], handler)
+        await adapter.subscribe(["test-topic"], broken_handler)
+
+        with pytest.raises(ValueError):
+            await adapter.publish("test-topic", {"test": 1})
+
+        assert all(coro.cr_frame is None for coro in created)
+
+    async def test_queued_publish_error_reaches_its_publisher(self, adapter):
+        """Test that a publish queued behind an in-flight delivery gets its own error."""
+        release = asyncio.Event()
+        received = []
+
+        async def slow_handler(topic, message):
+            await release.wait()
+
+        async def handler(topic, message):
+            received.append(topic)
+
+        def broken_handler(topic, message):
+            raise ValueError("cannot build delivery")
+
+        await adapter.subscribe(["slow.topic"], slow_handler)
+        await adapter.subscribe(["ok.topic"], handler)
+        await adapter.subscribe(["bad.topic"], broken_handler)
+
+        in_flight = asyncio.create_task(adapter.publish("slow.topic", {"n": 0}))
+        await asyncio.sleep(0)
+
+        # Both are queued while the slow delivery is in flight
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                adapter.publish("bad.topic", {"n": 1}),
+                adapter.publish("ok.topic", {"n": 2}),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+        release.set()
+        await in_flight
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] is None
+        assert received == ["ok.topic"]
+
+    async def test_publish_batch(self, adapter):
+        """Test that a batch is fully delivered, in order, before returning."""
+        received = []
+
+        async def handler(topic, message):
+            received.append((topic, message))
+
+        await adapter.subscribe(["batch.*"], handler)
+
+        await adapter.publish_batch([
+            ("batch.a", b'{"n": 1}'),
+            ("other.topic", b'{"n": 2}'),
+            ("batch.b", b'{"n": 3}'),
+        ])
+
+        assert received == [("batch.a", {"n": 1}), ("batch.b", {"n": 3})]
+
     async def test_handler_error_isolation(self, adapter):
         """Test that handler errors don't affect other handlers."""
         received = []
@@ -185,3 +372,106 @@ class TestMemoryAdapter:
         await adapter.publish("test-topic", {"test": 1})
         
         assert len(received) == 1
+    
+    async def test_single_handler_error_not_raised(self, adapter):
+        """Test that a lone failing handler doesn't propagate to the publisher."""
+        async def failing_handler(topic, message):
+            raise ValueError("Handler error")
+        
+        await adapter.subscribe(["test-topic"], failing_handler)
+        
+        # Should not raise
+        await adapter.publish("test-topic", {"test": 1})
+    
+    async def test_concurrent_publishes_all_delivered(self, adapter):
+        """Test that publishes issued together are all delivered before returning."""
+        received = []
+        
+        async def handler(topic, message):
+            received.append(message["n"])
+        
+        await adapter.subscribe(["batch.*"], handler)
+        
+        await asyncio.gather(
+            *(adapter.publish(f"batch.{n}", {"n": n}) for n in range(5))
+        )
+        
+        assert sorted(received) == [0, 1, 2, 3, 4]
+    
+    async def test_handler_can_publish(self, adapter):
+        """Test that a handler publishing during delivery doesn't deadlock."""
+        received = []
+        
+        async def forwarding_handler(topic, message):
+            await adapter.publish("second.topic", message)
+        
+        async def final_handler(topic, message):
+            received.append(topic)
+        
+        await adapter.subscribe(["first.topic"], forwarding_handler)
+        await adapter.subscribe(["second.topic"], final_handler)
+        
+        await asyncio.wait_for(adapter.publish("first.topic", {"test": 1}), timeout=1)
+        
+        assert received == ["second.topic"]
+    
+    async def test_large_fanout_error_isolation(self, adapter):
+        """Test error isolation when a publish fans out to many handlers."""
+        received = []
+        
+        async def failing_handler(topic, message):
+            raise ValueError("Handler error")
+        
+        async def working_handler(topic, message):
+            received.append(message)
+        
+        await adapter.subscribe(["fanout.topic"], failing_handler)
+        for _ in range(10):
+            await adapter.subscribe(["fanout.topic"], working_handler)
+        
+        await adapter.publish("fanout.topic", {"test": 1})
+        
+        assert len(received) == 10
+
+    async def test_fanout_handlers_run_concurrently(self, adapter):
+        """Test that one slow handler doesn't hold up the others in a fan-out."""
+        second_ran = asyncio.Event()
+
+        async def waiting_handler(topic, message):
+            # Only completes if the other handler runs while this one waits
+            await second_ran.wait()
+
+        async def signalling_handler(topic, message):
+            second_ran.set()
+
+        await adapter.subscribe(["fanout.topic"], waiting_handler)
+        await adapter.subscribe(["fanout.topic"], signalling_handler)
+
+        await asyncio.wait_for(adapter.publish("fanout.topic", {"test": 1}), timeout=1)
+
+        assert second_ran.is_set()
+
+    async def test_cancelled_publish_cancels_fanout_handlers(self, adapter):
+        """Test that cancelling a publisher also cancels its in-flight handlers."""
+        started = []
+        cancelled = []
+
+        async def handler(topic, message):
+            started.append(topic)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(topic)
+                raise
+
+        await adapter.subscribe(["fanout.topic"], handler)
+        await adapter.subscribe(["fanout.topic"], handler)
+
+        publish = asyncio.create_task(adapter.publish("fanout.topic", {"test": 1}))
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        publish.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await publish
+
+        assert cancelled == ["fanout.topic", "fanout.topic"]
@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 from httpx import ASGITransport, AsyncClient
 
@@ -38,7 +39,7 @@ async def test_publish_overwrites_payload_platform_tenant_id(async_client):
     payload = _base_event_payload()
     payload["event"]["platform_tenant_id"] = "spt_spoofed"
 
-    with patch("src.api.routes.events.event_manager.publish", new=AsyncMock()) as mock_publish:
+    with patch("src.api.routes.events.event_manager.publish_bytes", new=AsyncMock()) as mock_publish:
         response = await async_client.post(
             "/v1/events/publish",
             json=payload,
@@ -46,7 +47,7 @@ async def test_publish_overwrites_payload_platform_tenant_id(async_client):
         )
 
     assert response.status_code == 200
-    publish_message = mock_publish.await_args.args[1]
+    publish_message = orjson.loads(mock_publish.await_args.args[1])
     assert publish_message["platform_tenant_id"] == "spt_real"
 
 
@@ -55,7 +56,7 @@ async def test_publish_uses_default_platform_tenant_from_jwt(async_client):
     """JWT platform tenant claims may use DEFAULT_PLATFORM_TENANT_ID explicitly."""
     payload = _base_event_payload()
 
-    with patch("src.api.routes.events.event_manager.publish", new=AsyncMock()) as mock_publish:
+    with patch("src.api.routes.events.event_manager.publish_bytes", new=AsyncMock()) as mock_publish:
         response = await async_client.post(
             "/v1/events/publish",
             json=payload,
@@ -63,7 +64,7 @@ async def test_publish_uses_default_platform_tenant_from_jwt(async_client):
         )
 
     assert response.status_code == 200
-    publish_message = mock_publish.await_args.args[1]
+    publish_message = orjson.loads(mock_publish.await_args.args[1])
     assert publish_message["platform_tenant_id"] == DEFAULT_PLATFORM_TENANT_ID
 
 
@@ -73,7 +74,7 @@ async def test_publish_rejects_missing_tenant_id_after_sanitization(async_client
     payload = _base_event_payload()
     payload["event"]["tenant_id"] = "   "
 
-    with patch("src.api.routes.events.event_manager.publish", new=AsyncMock()) as mock_publish:
+    with patch("src.api.routes.events.event_manager.publish_bytes", new=AsyncMock()) as mock_publish:
         response = await async_client.post(
             "/v1/events/publish",
             json=payload,
@@ -91,7 +92,7 @@ async def test_publish_rejects_missing_user_id_after_sanitization(async_client,
     payload = _base_event_payload()
     payload["event"]["user_id"] = "   "
 
-    with patch("src.api.routes.events.event_manager.publish", new=AsyncMock()) as mock_publish:
+    with patch("src.api.routes.events.event_manager.publish_bytes", new=AsyncMock()) as mock_publish:
         response = await async_client.post(
             "/v1/events/publish",
             json=payload,
@@ -108,7 +109,7 @@ async def test_publish_rejects_oversized_platform_tenant_id(async_client):
     """Oversized platform_tenant_id claims must fail closed."""
     payload = _base_event_payload()
 
-    with patch("src.api.routes.events.event_manager.publish", new=AsyncMock()) as mock_publish:
+    with patch("src.api.routes.events.event_manager.publish_bytes", new=AsyncMock()) as mock_publish:
         response = await async_client.post(
             "/v1/events/publish",
             json=payload,
@@ -127,7 +128,7 @@ async def test_publish_trims_tenant_and_user_id(async_client, tenancy_headers):
     payload["event"]["tenant_id"] = "  svc_tenant  "
     payload["event"]["user_id"] = "  svc_user  "
 
-    with patch("src.api.routes.events.event_manager.publish", new=AsyncMock()) as mock_publish:
+    with patch("src.api.routes.events.event_manager.publish_bytes", new=AsyncMock()) as mock_publish:
         response = await async_client.post(
             "/v1/events/publish",
             json=payload,
@@ -135,6 +136,6 @@ async def test_publish_trims_tenant_and_user_id(async_client, tenancy_headers):
         )
 
     assert response.status_code == 200
-    publish_message = mock_publish.await_args.args[1]
+    publish_message = orjson.loads(mock_publish.await_args.args[1])
     assert publish_message["tenant_id"] == "svc_tenant"
     assert publish_message["user_id"] == "svc_user"
@@ -0,0 +1,156 @@
+"""
+Tests for NATS adapter helpers that do not need a running server.
+"""
+import pytest
+from src.adapters.nats_adapter import collapse_topics
+
+
+@pytest.mark.parametrize(
+    "topics,expected",
+    [
+        (["research.*", "research.completed"], ["research.*"]),
+        (["events.>", "events.a.b", "events.a"], ["events.>"]),
+        (["topic.a", "topic.a", "topic.b"], ["topic.a", "topic.b"]),
+        (["a.*.c", "a.b.>"], ["a.*.c", "a.b.>"]),
+        # "*" matches one token only, so it never covers ">"
+        (["a.*", "a.>"], ["a.>"]),
+        (["a.>", "a"], ["a.>", "a"]),
+    ],
+)
+def test_collapse_topics(topics, expected):
+    """Test that covered and duplicate topics are dropped, order preserved."""
+    assert collapse_topics(topics) == expected
+
+
+async def test_adapters_share_pooled_connection(monkeypatch):
+    """Test that adapters for one URL share a client drained by the last user."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.adapters import nats_adapter
+
+    client = MagicMock(is_closed=False, is_connected=True, drain=AsyncMock())
+    connect = AsyncMock(return_value=client)
+    monkeypatch.setattr(nats_adapter.nats, "connect", connect)
+
+    first = nats_adapter.NatsAdapter(url="nats://pool-test:4222")
+    second = nats_adapter.NatsAdapter(url="nats://pool-test:4222")
+    await first.connect()
+    await second.connect()
+
+    assert connect.await_count == 1
+
+    await first.disconnect()
+    client.drain.assert_not_awaited()
+    assert second.is_connected
+
+    await second.disconnect()
+    client.drain.assert_awaited_once()
+
+
+async def test_connect_while_reconnecting_counts_adapter_once(monkeypatch):
+    """Test that reconnecting an adapter mid-reconnect doesn't leak a pool reference."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.adapters import nats_adapter
+
+    client = MagicMock(is_closed=False, is_connected=True, drain=AsyncMock())
+    connect = AsyncMock(return_value=client)
+    monkeypatch.setattr(nats_adapter.nats, "connect", connect)
+
+    adapter = nats_adapter.NatsAdapter(url="nats://reconnect-test:4222")
+    await adapter.connect()
+
+    # Connection dropped; nats-py is reconnecting in the background
+    client.is_connected = False
+    await adapter.connect()
+
+    assert connect.await_count == 1
+    await adapter.disconnect()
+    client.drain.assert_awaited_once()
+
+
+async def test_pool_separates_reconnect_policies(monkeypatch):
+    """Test that adapters with different reconnect settings get their own client."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.adapters import nats_adapter
+
+    connect = AsyncMock(
+        side_effect=lambda **kwargs: MagicMock(
+            is_closed=False, is_connected=True, drain=AsyncMock()
+        )
+    )
+    monkeypatch.setattr(nats_adapter.nats, "connect", connect)
+
+    default = nats_adapter.NatsAdapter(url="nats://policy-test:4222")
+    bounded = nats_adapter.NatsAdapter(
+        url="nats://policy-test:4222", max_reconnect_attempts=3
+    )
+    await default.connect()
+    await bounded.connect()
+
+    assert connect.await_count == 2
+    assert connect.await_args_list[1].kwargs["max_reconnect_attempts"] == 3
+    assert default._client is not bounded._client
+
+    await default.disconnect()
+    await bounded.disconnect()
+
+
+def test_pool_is_per_event_loop(monkeypatch):
+    """Test that a client opened on one event loop is not reused on another."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.adapters import nats_adapter
+
+    connect = AsyncMock(
+        side_effect=lambda **kwargs: MagicMock(
+            is_closed=False, is_connected=True, drain=AsyncMock()
+        )
+    )
+    monkeypatch.setattr(nats_adapter.nats, "connect", connect)
+
+    first = nats_adapter.NatsAdapter(url="nats://loop-test:4222")
+    second = nats_adapter.NatsAdapter(url="nats://loop-test:4222")
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        loop_a.run_until_complete(first.connect())
+        loop_b.run_until_complete(second.connect())
+
+        assert connect.await_count == 2
+        assert first._client is not second._client
+
+        loop_a.run_until_complete(first.disconnect())
+        loop_b.run_until_complete(second.disconnect())
+    finally:
+        loop_a.close()
+        loop_b.close()
+
+
+async def test_raw_subscription_skips_decoding(monkeypatch):
+    """Test that deliver_raw hands the handler msg.data without decoding it."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.adapters import nats_adapter
+
+    client = MagicMock(is_closed=False, is_connected=True, drain=AsyncMock())
+    client.subscribe = AsyncMock()
+    monkeypatch.setattr(nats_adapter.nats, "connect", AsyncMock(return_value=client))
+
+    adapter = nats_adapter.NatsAdapter(url="nats://raw-test:4222")
+    await adapter.connect()
+
+    received = []
+
+    async def handler(topic, message):
+        received.append((topic, message))
+
+    await adapter.subscribe(["orders.created"], handler, deliver_raw=True)
+    callback = client.subscribe.await_args.kwargs["cb"]
+
+    # Not valid JSON: a decoding subscriber would drop it
+    await callback(MagicMock(subject="soorma.events.orders.created", data=b"raw-bytes"))
+
+    assert received == [("orders.created", b"raw-bytes")]
+    await adapter.disconnect()
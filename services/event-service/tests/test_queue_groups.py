@@ -2,12 +2,18 @@ import pytest
 import asyncio
 from src.adapters.memory_adapter import MemoryAdapter
 
-@pytest.mark.asyncio
-async def test_queue_group_distribution():
-    """Test that messages are distributed round-robin within a queue group."""
+
+@pytest.fixture
+async def adapter():
+    """Create and connect a memory adapter for testing."""
     adapter = MemoryAdapter()
     await adapter.connect()
-    
+    yield adapter
+    await adapter.disconnect()
+
+@pytest.mark.asyncio
+async def test_queue_group_distribution(adapter):
+    """Test that messages are distributed round-robin within a queue group."""
     received_a = []
     received_b = []
     received_c = []
@@ -41,15 +47,10 @@ async def test_queue_group_distribution():
     assert len(received_a) == 1
     assert len(received_b) == 1
     assert len(received_c) == 1
-    
-    await adapter.disconnect()
 
 @pytest.mark.asyncio
-async def test_mixed_broadcast_and_queue_group():
+async def test_mixed_broadcast_and_queue_group(adapter):
     """Test mixing broadcast subscribers and queue groups."""
-    adapter = MemoryAdapter()
-    await adapter.connect()
-    
     broadcast_msgs = []
     group_msgs_1 = []
     group_msgs_2 = []
@@ -81,5 +82,106 @@ async def test_mixed_broadcast_and_queue_group():
     assert len(group_msgs_1) + len(group_msgs_2) == 2
     assert len(group_msgs_1) == 1
     assert len(group_msgs_2) == 1
+
+@pytest.mark.asyncio
+async def test_queue_group_round_robin_over_matching_members(adapter):
+    """Test round-robin only advances past members that matched the topic."""
+    received_a = []
+    received_b = []
     
-    await adapter.disconnect()
+    async def handler_a(topic, msg):
+        received_a.append(msg)
+        
+    async def handler_b(topic, msg):
+        received_b.append(msg)
+        
+    # Same group, but only handler_a matches "orders.updated"
+    await adapter.subscribe(["orders.*"], handler_a, queue_group="workers")
+    await adapter.subscribe(["orders.created"], handler_b, queue_group="workers")
+    
+    await adapter.publish("orders.updated", {"id": 1})
+    await adapter.publish("orders.created", {"id": 2})
+    await adapter.publish("orders.created", {"id": 3})
+    
+    # handler_a took the first message, so handler_b is next in line
+    assert received_a == [{"id": 1}, {"id": 3}]
+    assert received_b == [{"id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_queue_group_skipped_member_keeps_turn(adapter):
+    """Test that choosing a middle member doesn't send skipped members to the back."""
+    received = {"a": [], "b": [], "c": []}
+    
+    def make_handler(name):
+        async def handler(topic, msg):
+            received[name].append(msg["id"])
+        return handler
+    
+    # Ring order a, b, c; only b and c match "orders.created"
+    await adapter.subscribe(["orders.updated"], make_handler("a"), queue_group="workers")
+    await adapter.subscribe(["orders.*"], make_handler("b"), queue_group="workers")
+    await adapter.subscribe(["orders.*"], make_handler("c"), queue_group="workers")
+    
+    # b (the middle member) is chosen; a was skipped and stays at the front
+    await adapter.publish("orders.created", {"id": 1})
+    await adapter.publish("orders.updated", {"id": 2})
+    await adapter.publish("orders.created", {"id": 3})
+    
+    assert received == {"a": [2], "b": [1], "c": [3]}
+
+
+@pytest.mark.asyncio
+async def test_queue_group_predicate_skips_member(adapter):
+    """Test that a member whose predicate rejects a message doesn't use up its turn."""
+    even = []
+    anything = []
+    
+    async def handler_even(topic, msg):
+        even.append(msg["id"])
+        
+    async def handler_anything(topic, msg):
+        anything.append(msg["id"])
+        
+    await adapter.subscribe(
+        ["test.topic"], handler_even, queue_group="workers",
+        predicate=lambda m: m["id"] % 2 == 0,
+    )
+    await adapter.subscribe(["test.topic"], handler_anything, queue_group="workers")
+    
+    for i in range(1, 5):
+        await adapter.publish("test.topic", {"id": i})
+    
+    # 1 is odd, so handler_even keeps its turn and takes 2
+    assert even == [2, 4]
+    assert anything == [1, 3]
+
+@pytest.mark.asyncio
+async def test_streams_with_same_agent_name_share_deliveries():
+    """Test that SSE streams for one agent_name form a single queue group."""
+    from src.services.event_manager import EventManager
+
+    manager = EventManager()
+    manager.adapter = MemoryAdapter()
+    await manager.adapter.connect()
+
+    streams = [
+        manager.create_stream(["test.topic"], agent_id=f"worker-{i}", agent_name="worker")
+        for i in range(2)
+    ]
+    # First frame is "connected", emitted once the subscription is active
+    for stream in streams:
+        assert (await stream.__anext__()).startswith(b"event: connected")
+
+    await manager.publish("test.topic", {"id": 1})
+    await manager.publish("test.topic", {"id": 2})
+
+    frames = [await stream.__anext__() for stream in streams]
+    assert sorted(frames) == [
+        b'event: message\ndata: {"id":1}\n\n',
+        b'event: message\ndata: {"id":2}\n\n',
+    ]
+
+    for stream in streams:
+        await stream.aclose()
+    await manager.adapter.disconnect()
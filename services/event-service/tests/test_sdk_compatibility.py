@@ -1,6 +1,7 @@
+import orjson
 import pytest
 from datetime import datetime, timezone
-from src.models.schemas import PublishRequest, EventPayload
+from src.models.schemas import PublishRequest, EventPayload, encode_event_payload
 
 def test_event_envelope_serialization():
     """Test that EventEnvelope serializes correctly for SDK compatibility."""
@@ -24,11 +25,9 @@ def test_event_envelope_serialization():
     
     # Check to_cloudevents_dict output
     ce_dict = event.to_cloudevents_dict()
-    print(f"\nCloudEvents Dict: {ce_dict.keys()}")
     
     # Check model_dump output
     dump_dict = event.model_dump(mode='json', exclude_none=True)
-    print(f"\nModel Dump: {dump_dict.keys()}")
     
     # SDK expects 'correlation_id', not 'correlationid'
     assert "correlation_id" in dump_dict
@@ -44,3 +43,6 @@ def test_event_envelope_serialization():
     # Verify topic is string
     assert isinstance(dump_dict["topic"], str)
     assert dump_dict["topic"] == "business-facts"
+    
+    # The publish path encodes straight to bytes; it must match model_dump
+    assert orjson.loads(encode_event_payload(event)) == dump_dict
@@ -1,65 +1,83 @@
 import pytest
 import asyncio
-import json
-import uvicorn
-from httpx import AsyncClient
 from src.main import app
 from src.services.event_manager import event_manager
 from .conftest import build_auth_headers
 
-@pytest.fixture
-async def server():
-    config = uvicorn.Config(app, host="127.0.0.1", port=8001, log_level="debug")
-    server = uvicorn.Server(config)
-    task = asyncio.create_task(server.serve())
-    # Wait for server to start
-    while not server.started:
-        await asyncio.sleep(0.1)
-    yield
-    server.should_exit = True
-    await task
+
+def _http_scope(path: str, query_string: bytes, headers: dict[str, str]) -> dict:
+    """Build an ASGI HTTP scope for a GET request."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        ],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
 
 @pytest.mark.asyncio
-async def test_sse_stream_integration(server):
+async def test_sse_stream_integration():
     """
     Test that an SSE stream receives published events.
+
+    The app is driven through its ASGI interface so frames are observed as
+    they are sent; httpx's ASGITransport would wait for the (endless)
+    response to complete before returning any of it.
     """
     agent_id = "test-subscriber"
     topics = "test.topic"
-    
+
     # Ensure adapter is initialized
     if not event_manager.adapter or not event_manager.adapter.is_connected:
          await event_manager.initialize()
 
-    # Background task to publish an event after a delay
-    async def publish_delayed():
-        await asyncio.sleep(2)
-        await event_manager.publish("test.topic", {"foo": "bar"})
+    scope = _http_scope(
+        "/v1/events/stream",
+        f"topics={topics}&agent_id={agent_id}".encode(),
+        build_auth_headers(),
+    )
+    request_sent = False
+    client_gone = asyncio.Event()
+    status = []
+    found_connected = asyncio.Event()
+    found_message = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await client_gone.wait()
+        return {"type": "http.disconnect"}
 
-    asyncio.create_task(publish_delayed())
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if b"event: connected" in body:
+                found_connected.set()
+            if b"event: message" in body and found_connected.is_set():
+                found_message.set()
 
-    # Start the stream request
-    async with AsyncClient(base_url="http://127.0.0.1:8001") as client:
-        async with client.stream(
-            "GET",
-            f"/v1/events/stream?topics={topics}&agent_id={agent_id}",
-            headers=build_auth_headers(),
-        ) as response:
-            assert response.status_code == 200
-            
-            lines = response.aiter_lines()
-            
-            found_connected = False
-            found_message = False
-            
-            async for line in lines:
-                if "event: connected" in line:
-                    found_connected = True
-                if "event: message" in line:
-                    found_message = True
-                    if found_connected:
-                        break
-            
-            assert found_connected, "Did not receive connected event"
-            assert found_message, "Did not receive message event"
+    app_task = asyncio.create_task(app(scope, receive, send))
+    try:
+        # The connected frame is sent once the subscription is active
+        await asyncio.wait_for(found_connected.wait(), timeout=5)
+        assert status == [200]
 
+        await event_manager.publish("test.topic", {"foo": "bar"})
+        await asyncio.wait_for(found_message.wait(), timeout=5)
+    finally:
+        client_gone.set()
+        await asyncio.wait_for(app_task, timeout=5)
@@ -7,6 +7,7 @@ Create Date: 2025-12-23
 """
 from alembic import op
 import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
 from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
@@ -64,7 +65,7 @@ def upgrade() -> None:
         sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v4()'), nullable=False),
         sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('embedding', postgresql.ARRAY(sa.Float()), nullable=True),  # Will be converted to vector
+        sa.Column('embedding', Vector(1536), nullable=True),
         sa.Column('memory_metadata', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
@@ -72,9 +73,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
 
-    # Alter embedding column to use vector type
-    op.execute('ALTER TABLE semantic_memory ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)')
-
     # Create HNSW index for semantic_memory
     op.execute('CREATE INDEX semantic_embedding_idx ON semantic_memory USING hnsw (embedding vector_cosine_ops)')
 
@@ -94,7 +92,7 @@ def upgrade() -> None:
         sa.Column('agent_id', sa.Text(), nullable=False),
         sa.Column('role', sa.Text(), nullable=False),
         sa.Column('content', sa.Text(), nullable=False),
-        sa.Column('embedding', postgresql.ARRAY(sa.Float()), nullable=True),
+        sa.Column('embedding', Vector(1536), nullable=True),
         sa.Column('memory_metadata', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
         sa.CheckConstraint("role IN ('user', 'assistant', 'system', 'tool')", name='role_check'),
@@ -103,9 +101,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
 
-    # Alter embedding column to use vector type
-    op.execute('ALTER TABLE episodic_memory ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)')
-
     # Create indexes for episodic_memory
     op.execute('CREATE INDEX episodic_embedding_idx ON episodic_memory USING hnsw (embedding vector_cosine_ops)')
     op.create_index('episodic_time_idx', 'episodic_memory', ['user_id', 'agent_id', sa.text('created_at DESC')])
@@ -128,7 +123,7 @@ def upgrade() -> None:
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('agent_id', sa.Text(), nullable=False),
         sa.Column('trigger_condition', sa.Text(), nullable=True),
-        sa.Column('embedding', postgresql.ARRAY(sa.Float()), nullable=True),
+        sa.Column('embedding', Vector(1536), nullable=True),
         sa.Column('procedure_type', sa.Text(), nullable=False),
         sa.Column('content', sa.Text(), nullable=False),
         sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
@@ -138,9 +133,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
 
-    # Alter embedding column to use vector type
-    op.execute('ALTER TABLE procedural_memory ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)')
-
     # Create HNSW index for procedural_memory
     op.execute('CREATE INDEX procedural_embedding_idx ON procedural_memory USING hnsw (embedding vector_cosine_ops)')
 
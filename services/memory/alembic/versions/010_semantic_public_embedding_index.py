@@ -0,0 +1,70 @@
+"""Add a partial HNSW index over public semantic knowledge.
+
+Revision ID: 010_semantic_public_hnsw
+Revises: 009_scope_constraint_parity
+Create Date: 2026-10-17
+
+Searches restricted to public knowledge (is_public = TRUE) can walk a graph
+built only from public rows instead of the full semantic_embedding_idx. The
+unfiltered index is kept: private-only and private-plus-public searches still
+need it.
+
+The build uses the server's maintenance settings. Operators with headroom can
+raise them for this migration only via MIGRATION_MAINTENANCE_WORK_MEM (e.g.
+"1GB") and MIGRATION_MAX_PARALLEL_MAINTENANCE_WORKERS (e.g. "4"); PostgreSQL
+still caps workers by max_worker_processes and max_parallel_workers.
+"""
+
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "010_semantic_public_hnsw"
+down_revision = "009_scope_constraint_parity"
+branch_labels = None
+depends_on = None
+
+# Same HNSW graph parameters as pgvector's defaults used by 001
+HNSW_OPTIONS = "m = 16, ef_construction = 64"
+
+# Session setting -> environment variable that overrides it for the build
+BUILD_SETTINGS = {
+    "maintenance_work_mem": "MIGRATION_MAINTENANCE_WORK_MEM",
+    "max_parallel_maintenance_workers": "MIGRATION_MAX_PARALLEL_MAINTENANCE_WORKERS",
+}
+
+
+def upgrade() -> None:
+    """Build the public-only embedding index without blocking writes."""
+    # CONCURRENTLY cannot run inside the migration transaction. Overridden
+    # settings apply to the same autocommit session and are reset afterwards.
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        overridden = []
+        for setting, env_var in BUILD_SETTINGS.items():
+            value = os.environ.get(env_var)
+            if value:
+                conn.execute(
+                    sa.text("SELECT set_config(:name, :value, false)"),
+                    {"name": setting, "value": value},
+                )
+                overridden.append(setting)
+        try:
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS semantic_embedding_public_idx
+                ON semantic_memory USING hnsw (embedding vector_cosine_ops)
+                WITH ({HNSW_OPTIONS})
+                WHERE is_public = TRUE
+            """)
+        finally:
+            for setting in overridden:
+                op.execute(f"RESET {setting}")
+
+
+def downgrade() -> None:
+    """Drop the public-only embedding index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS semantic_embedding_public_idx")
@@ -0,0 +1,34 @@
+"""Index plan_context.correlation_ids for by-correlation lookups.
+
+Revision ID: 011_plan_context_correlation_gin
+Revises: 010_semantic_public_hnsw
+Create Date: 2026-10-17
+
+get_plan_by_correlation filters on ``correlation_ids @> '["<id>"]'``. A GIN
+index with the jsonb_path_ops operator class supports exactly that
+containment operator and is smaller than the default jsonb_ops index.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "011_plan_context_correlation_gin"
+down_revision = "010_semantic_public_hnsw"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the correlation_ids GIN index without blocking planner writes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_plan_context_correlation_ids "
+            "ON plan_context USING GIN (correlation_ids jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the correlation_ids GIN index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_plan_context_correlation_ids")
@@ -142,6 +142,7 @@ async def get_plan_by_correlation(
     """Find plan by task/step correlation ID."""
     # Use PostgreSQL JSONB containment operator @>
     # Check if correlation_ids array contains the correlation_id
+    # (@> is the operator ix_plan_context_correlation_ids' jsonb_path_ops serves)
     result = await db.execute(
         select(PlanContext).where(
             *scoped_identity_filters(